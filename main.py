@@ -6,26 +6,30 @@
 from __future__ import annotations
 
 import argparse
-import io
 import os
 import sys
+from functools import lru_cache
 
-from youtube_downloader.cli import CommandLineInterface
 from youtube_downloader.config import ConfigManager
-from youtube_downloader.constants import VERSION
-from youtube_downloader.downloader import YouTubeDownloader
-from youtube_downloader.gui import GUI_AVAILABLE, GraphicalUserInterface
-from youtube_downloader.versioning import yt_dlp_version
+from youtube_downloader.constants import MAX_WORKERS_LIMIT, VERSION
 
 # Force UTF-8 stdout/stderr to avoid encoding errors on Windows consoles.
-if hasattr(sys.stdout, "buffer"):
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
-if hasattr(sys.stderr, "buffer"):
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
+for _stream in (sys.stdout, sys.stderr):
+    if hasattr(_stream, "reconfigure"):
+        _stream.reconfigure(encoding="utf-8", errors="replace")
+
+
+@lru_cache(maxsize=1)
+def _get_config_manager() -> ConfigManager:
+    """Return the one ConfigManager shared by whichever interface runs."""
+    return ConfigManager()
 
 
 def _run_cli_with_url(args: argparse.Namespace) -> None:
-    config_manager = ConfigManager()
+    # yt-dlp loads all of its extractors on import; only pay for it here.
+    from youtube_downloader.downloader import YouTubeDownloader
+
+    config_manager = _get_config_manager()
     downloader = YouTubeDownloader(config_manager)
 
     options = config_manager.get_download_options()
@@ -41,9 +45,9 @@ def _run_cli_with_url(args: argparse.Namespace) -> None:
         options.convert_to_mp3 = True
 
     if args.max_workers:
-        options.max_workers = args.max_workers
+        options.max_workers = max(1, min(args.max_workers, MAX_WORKERS_LIMIT))
 
-    os.makedirs(options.download_dir, exist_ok=True)
+    downloader.ensure_dir(options.download_dir)
 
     try:
         success = downloader.download(args.url, options)
@@ -76,16 +80,21 @@ def main() -> None:
     parser.add_argument(
         "--max-workers",
         type=int,
-        default=1,
-        help="Số luồng tải song song (mặc định: 1)",
+        help=(
+            f"Số luồng tải song song, 1-{MAX_WORKERS_LIMIT} "
+            "(mặc định: theo cấu hình, giới hạn đổi qua YT_DL_MAX_WORKERS)"
+        ),
     )
 
     args = parser.parse_args()
 
     if (not args.cli and not args.url) or args.gui:
+        # Only GUI runs load the GUI module; CLI and --url runs skip it.
+        from youtube_downloader.gui import GUI_AVAILABLE, GraphicalUserInterface
+
         if GUI_AVAILABLE:
             try:
-                app = GraphicalUserInterface()
+                app = GraphicalUserInterface(_get_config_manager())
                 app.run()
                 return
             except Exception as exc:
@@ -98,7 +107,9 @@ def main() -> None:
     if args.url:
         _run_cli_with_url(args)
     else:
-        cli = CommandLineInterface()
+        from youtube_downloader.cli import CommandLineInterface
+
+        cli = CommandLineInterface(_get_config_manager())
         cli.run()
 
 
@@ -2,23 +2,48 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 
-from .constants import LOG_FILE, LOG_FORMAT
+from .constants import LOG_BACKUP_COUNT, LOG_FILE, LOG_FORMAT, LOG_MAX_BYTES
 
 
 def _configure_logging() -> None:
-    """Configure application-wide logging only once."""
+    """Configure application-wide logging only once.
+
+    Records are handed to a queue and written by a listener thread, so
+    download workers never block on log file or console I/O.
+    """
     if getattr(_configure_logging, "_configured", False):
         return
 
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
+    )
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    # The queue handler only merges args into the message; the listener's
+    # handlers apply LOG_FORMAT.
     logging.basicConfig(
         level=logging.INFO,
-        format=LOG_FORMAT,
-        handlers=[
-            logging.FileHandler(LOG_FILE, encoding="utf-8"),
-            logging.StreamHandler(),
-        ],
+        format="%(message)s",
+        handlers=[logging.handlers.QueueHandler(log_queue)],
     )
     _configure_logging._configured = True  # type: ignore[attr-defined]
 
@@ -5,47 +5,91 @@ from __future__ import annotations
 import logging
 import os
 import sys
+import threading
+import unicodedata
+from typing import Optional, Tuple
 
 from .config import ConfigManager
-from .constants import VERSION
+from .constants import MAX_STREAMS_PER_FILE, MAX_WORKERS_LIMIT, VERSION
 from .downloader import YouTubeDownloader
 from .models import DownloadOptions, PlaylistInfo, VideoInfo
-from .utils import format_duration
+from .utils import format_count, format_duration
 from .versioning import VersionChecker, yt_dlp_version
 
 logger = logging.getLogger(__name__)
 
+# Carriage return plus "erase line", so progress redraws in place.
+_CLEAR_LINE = "\r\033[K"
+
+_YES_ANSWERS = frozenset({"y", "yes", "có", "co"})
+
+# Menu answers are digits, so they are only stripped, never case-folded.
+_DOWNLOAD_MODES = frozenset({"1", "2", "3", "4"})
+_MP3_QUALITIES = {"1": "128", "2": "192", "3": "256", "4": "320"}
+
+
+def _ask_yes_no(prompt: str, default: bool = False) -> bool:
+    """Ask a y/n question; an empty answer gives ``default``, anything
+    else but an explicit yes counts as no."""
+    # macOS terminals may send "có" decomposed, so compare in NFC form.
+    answer = unicodedata.normalize("NFC", input(prompt).strip().lower())
+    if not answer:
+        return default
+    return answer in _YES_ANSWERS
+
 
 class CommandLineInterface:
     """Interactive console workflow."""
 
-    def __init__(self) -> None:
-        self.config_manager = ConfigManager()
+    def __init__(self, config_manager: Optional[ConfigManager] = None) -> None:
+        self.config_manager = config_manager or ConfigManager()
         self.downloader = YouTubeDownloader(self.config_manager)
         self.downloader.add_progress_callback(self.update_progress)
         self.current_task = None
+        self._last_line = ""
+
+        # Check for updates and initialise yt-dlp while the user reads the
+        # banner and types a URL.
+        self._update_result: Optional[Tuple[bool, str]] = None
+        self._update_checked = threading.Event()
+        threading.Thread(target=self._warm_up, name="warmup", daemon=True).start()
+
+    def _warm_up(self) -> None:
+        try:
+            if self.config_manager.general.check_for_updates:
+                self._update_result = VersionChecker.check_for_updates()
+        finally:
+            self._update_checked.set()
+        self.downloader.warm_up()
 
     def update_progress(self, task) -> None:
         self.current_task = task
 
-        if task.progress.status == "downloading":
-            sys.stdout.write("\r\033[K")
-            if task.index > 0 and task.total > 0:
-                sys.stdout.write(f"[{task.index}/{task.total}] ")
-            sys.stdout.write(f"{task.progress}")
-            sys.stdout.flush()
-        elif task.progress.status == "finished":
-            sys.stdout.write("\r\033[K")
-            if task.index > 0 and task.total > 0:
-                print(f"[{task.index}/{task.total}] Đã tải xong: {task.progress.filename}")
-            else:
-                print(f"Đã tải xong: {task.progress.filename}")
-        elif task.progress.status == "error":
-            sys.stdout.write("\r\033[K")
-            if task.index > 0 and task.total > 0:
-                print(f"[{task.index}/{task.total}] Lỗi: {task.progress.error_message}")
-            else:
-                print(f"Lỗi: {task.progress.error_message}")
+        status = task.progress.status
+        if status == "downloading":
+            line = f"{task.progress_prefix}{task.progress}"
+            if line == self._last_line:
+                return
+            self._last_line = line
+            output = f"{_CLEAR_LINE}{line}"
+        elif status == "finished":
+            self._last_line = ""
+            output = (
+                f"{_CLEAR_LINE}{task.progress_prefix}"
+                f"Đã tải xong: {task.progress.filename}\n"
+            )
+        elif status == "error":
+            self._last_line = ""
+            output = (
+                f"{_CLEAR_LINE}{task.progress_prefix}"
+                f"Lỗi: {task.progress.error_message}\n"
+            )
+        else:
+            return
+
+        # One write and one flush per update: a single syscall per tick.
+        sys.stdout.write(output)
+        sys.stdout.flush()
 
     @staticmethod
     def display_video_info(info: VideoInfo) -> None:
@@ -54,7 +98,7 @@ class CommandLineInterface:
         print(f"Kênh: {info.uploader}")
         print(f"Thời lượng: {format_duration(info.duration)}")
         if info.view_count:
-            print(f"Lượt xem: {info.view_count:,}".replace(",", "."))
+            print(f"Lượt xem: {format_count(info.view_count)}")
         print(f"Ngày đăng: {info.upload_date}")
 
     @staticmethod
@@ -74,33 +118,21 @@ class CommandLineInterface:
     @staticmethod
     def list_formats(info: VideoInfo, audio_only: bool = False) -> None:
         if audio_only:
-            audio_formats = [f for f in info.formats if not f.has_video]
-            audio_formats.sort(key=lambda f: f.bitrate, reverse=True)
-
             print("\nCác format audio tìm thấy:")
-            for fmt in audio_formats:
+            for fmt in info.audio_formats_sorted:
                 print(f" • {fmt}")
             return
 
-        video_formats = [f for f in info.formats if f.has_video]
-        video_formats.sort(
-            key=lambda f: int(f.resolution.replace("p", ""))
-            if f.resolution.replace("p", "").isdigit()
-            else 0,
-            reverse=True,
-        )
-
         print("\nCác format video tìm thấy:")
-        for fmt in video_formats:
+        for fmt in info.video_formats_sorted:
             print(f" • {fmt}")
 
     @staticmethod
     def confirm_large_playlist(count: int) -> bool:
         if count > 10:
-            response = input(
+            return _ask_yes_no(
                 f"Playlist này có {count} video. Bạn có chắc muốn tải tất cả? (y/n): "
-            ).strip().lower()
-            return response in ("y", "yes", "có", "co")
+            )
         return True
 
     def setup_download_options(self, mode: str) -> DownloadOptions:
@@ -127,8 +159,7 @@ class CommandLineInterface:
             print("  3) Cao (256 kbps)")
             print("  4) Rất cao (320 kbps)")
             quality_choice = input("Lựa chọn (1-4, mặc định: 2): ").strip() or "2"
-            quality_map = {"1": "128", "2": "192", "3": "256", "4": "320"}
-            options.audio_quality = quality_map.get(quality_choice, "192")
+            options.audio_quality = _MP3_QUALITIES.get(quality_choice, "192")
 
             print(
                 f"→ Bắt đầu tải audio chất lượng cao nhất và chuyển sang MP3 {options.audio_quality}kbps..."
@@ -153,33 +184,42 @@ class CommandLineInterface:
             options.merge = "+" in format_id
             options.merge_format = "mp4"
 
-        if (
-            input("Bạn có muốn cấu hình các tùy chọn nâng cao? (y/n, mặc định: n): ")
-            .strip()
-            .lower()
-            in ("y", "yes", "có", "co")
+        if _ask_yes_no(
+            "Bạn có muốn cấu hình các tùy chọn nâng cao? (y/n, mặc định: n): "
         ):
             max_workers = input(
-                f"Số lượng tải song song (1-10, mặc định: {options.max_workers}): "
+                f"Số lượng tải song song (1-{MAX_WORKERS_LIMIT}, "
+                f"mặc định: {options.max_workers}): "
             ).strip()
-            if max_workers.isdigit() and 1 <= int(max_workers) <= 10:
+            if max_workers.isdigit() and 1 <= int(max_workers) <= MAX_WORKERS_LIMIT:
                 options.max_workers = int(max_workers)
 
+            default_adaptive = "y" if options.adaptive_concurrency else "n"
+            options.adaptive_concurrency = _ask_yes_no(
+                "Tự giảm số luồng khi máy chủ giới hạn tốc độ? "
+                f"(y/n, mặc định: {default_adaptive}): ",
+                default=options.adaptive_concurrency,
+            )
+
+            streams = input(
+                f"Số kết nối cho mỗi video (1-{MAX_STREAMS_PER_FILE}, "
+                f"mặc định: {options.streams_per_file}): "
+            ).strip()
+            if streams.isdigit() and 1 <= int(streams) <= MAX_STREAMS_PER_FILE:
+                options.streams_per_file = int(streams)
+
             rate_limit = input(
                 "Giới hạn tốc độ tải (ví dụ: 500K, để trống nếu không giới hạn): "
             ).strip()
             if rate_limit:
                 options.rate_limit = rate_limit
 
-            download_thumbnails = (
-                input("Tải thumbnail? (y/n, mặc định: n): ").strip().lower()
+            options.download_thumbnails = _ask_yes_no(
+                "Tải thumbnail? (y/n, mặc định: n): "
             )
-            options.download_thumbnails = download_thumbnails in ("y", "yes", "có", "co")
-
-            download_subtitles = (
-                input("Tải subtitle? (y/n, mặc định: n): ").strip().lower()
+            options.download_subtitles = _ask_yes_no(
+                "Tải subtitle? (y/n, mặc định: n): "
             )
-            options.download_subtitles = download_subtitles in ("y", "yes", "có", "co")
 
             if options.download_subtitles:
                 subtitle_langs = input(
@@ -190,14 +230,12 @@ class CommandLineInterface:
                         lang.strip() for lang in subtitle_langs.split(",") if lang.strip()
                     ]
 
-            use_proxy = input("Sử dụng proxy? (y/n, mặc định: n): ").strip().lower()
-            if use_proxy in ("y", "yes", "có", "co"):
+            if _ask_yes_no("Sử dụng proxy? (y/n, mặc định: n): "):
                 proxy = input("Nhập địa chỉ proxy (ví dụ: socks5://127.0.0.1:1080): ").strip()
                 if proxy:
                     options.proxy = proxy
 
-            use_cookies = input("Sử dụng cookies? (y/n, mặc định: n): ").strip().lower()
-            if use_cookies in ("y", "yes", "có", "co"):
+            if _ask_yes_no("Sử dụng cookies? (y/n, mặc định: n): "):
                 cookies_file = input("Nhập đường dẫn đến file cookies: ").strip()
                 if cookies_file:
                     options.use_cookies = True
@@ -212,13 +250,11 @@ class CommandLineInterface:
         print(f"yt-dlp: {yt_dlp_version}")
         print("Cảnh báo: Cần cài đặt FFmpeg để chuyển đổi định dạng\n")
 
-        has_update, latest_version = VersionChecker.check_for_updates()
+        self._update_checked.wait()
+        has_update, latest_version = self._update_result or (False, yt_dlp_version)
         if has_update:
             print(f"Có phiên bản mới của yt-dlp: {latest_version} (hiện tại: {yt_dlp_version})")
-            if (
-                input("Bạn có muốn cập nhật ngay? (y/n): ").strip().lower()
-                in ("y", "yes", "có", "co")
-            ):
+            if _ask_yes_no("Bạn có muốn cập nhật ngay? (y/n): "):
                 if VersionChecker.update_yt_dlp():
                     print(
                         "Đã cập nhật yt-dlp thành công. Vui lòng khởi động lại ứng dụng."
@@ -228,13 +264,8 @@ class CommandLineInterface:
 
         tasks_data = self.config_manager.load_download_state()
         if tasks_data:
-            if (
-                input(
-                    f"Tìm thấy {len(tasks_data)} tải xuống bị gián đoạn. Bạn có muốn tiếp tục? (y/n): "
-                )
-                .strip()
-                .lower()
-                in ("y", "yes", "có", "co")
+            if _ask_yes_no(
+                f"Tìm thấy {len(tasks_data)} tải xuống bị gián đoạn. Bạn có muốn tiếp tục? (y/n): "
             ):
                 self.downloader.resume_downloads()
                 print("\nHoàn tất! Tất cả các tải xuống đã được xử lý.")
@@ -272,7 +303,7 @@ Chọn chế độ tải:
 """
             )
             mode = input("Lựa chọn (1/2/3/4): ").strip()
-            if mode not in ("1", "2", "3", "4"):
+            if mode not in _DOWNLOAD_MODES:
                 print("Lựa chọn không hợp lệ. Chạy lại và chọn 1, 2, 3 hoặc 4.")
                 return
 
@@ -297,3 +328,6 @@ Chọn chế độ tải:
             logger.exception("Lỗi CLI")
         finally:
             self.downloader.cleanup()
+            # Options chosen in this session; atexit would also catch them,
+            # but not if the interpreter is torn down abruptly.
+            self.config_manager.flush()
@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import atexit
 import configparser
-import json
+import io
 import logging
 import os
-from datetime import datetime
+import time
+from dataclasses import replace
 from typing import Any, Dict, List
 
-from .constants import CONFIG_FILE, DEFAULT_DOWNLOAD_DIR, STATE_FILE
-from .models import DownloadOptions, DownloadTask
+from .constants import (
+    CONFIG_FILE,
+    DEFAULT_DOWNLOAD_DIR,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_STREAMS_PER_FILE,
+    STATE_FILE,
+)
+from .models import DownloadOptions, DownloadTask, GeneralOptions
+from .utils import atomic_write, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+STATE_MAX_AGE = 7 * 24 * 60 * 60
+
 
 class ConfigManager:
     """Persist application preferences and download state."""
@@ -21,24 +32,106 @@ class ConfigManager:
     def __init__(self, config_file: str = CONFIG_FILE, state_file: str = STATE_FILE):
         self.config_file = config_file
         self.state_file = state_file
-        self.config = configparser.ConfigParser()
+        # Values are plain strings; "%" in paths must not trigger interpolation.
+        self.config = configparser.ConfigParser(interpolation=None)
+        self._dirty = False
+        self.general = GeneralOptions()
+        self._options_template = DownloadOptions()
         self.load_config()
+        atexit.register(self.flush)
 
     def load_config(self) -> None:
-        if os.path.exists(self.config_file):
-            try:
-                self.config.read(self.config_file)
-                logger.info("Đã tải cấu hình từ %s", self.config_file)
-            except Exception as exc:
-                logger.error("Lỗi khi tải cấu hình: %s", exc)
-                self.create_default_config()
-        else:
+        try:
+            # save_config writes UTF-8, so read it back the same way.
+            with open(self.config_file, encoding="utf-8") as config_file:
+                self.config.read_file(config_file)
+            logger.info("Đã tải cấu hình từ %s", self.config_file)
+        except FileNotFoundError:
             self.create_default_config()
+        except Exception as exc:
+            logger.error("Lỗi khi tải cấu hình: %s", exc)
+            self.create_default_config()
+        self._rebuild_options_cache()
+
+    def _rebuild_options_cache(self) -> None:
+        """Re-parse the INI data into the typed views handed out to callers."""
+        self.general = self._read_general()
+        self._options_template = self._read_download_options()
+
+    def _read_general(self) -> GeneralOptions:
+        """Parse the ``[general]`` section into the cached typed view."""
+        return GeneralOptions(
+            download_dir=self.config.get(
+                "general", "download_dir", fallback=DEFAULT_DOWNLOAD_DIR
+            ),
+            max_workers=self._getint("general", "max_workers", DEFAULT_MAX_WORKERS),
+            check_for_updates=self._getboolean("general", "check_for_updates", True),
+        )
+
+    def _getint(self, section: str, key: str, fallback: int) -> int:
+        """Read an int, falling back on a malformed value instead of raising."""
+        try:
+            return self.config.getint(section, key, fallback=fallback)
+        except ValueError:
+            logger.warning(
+                "Giá trị không hợp lệ cho %s.%s, dùng mặc định: %s",
+                section,
+                key,
+                fallback,
+            )
+            return fallback
+
+    def _getboolean(self, section: str, key: str, fallback: bool) -> bool:
+        """Read a bool, falling back on a malformed value instead of raising."""
+        try:
+            return self.config.getboolean(section, key, fallback=fallback)
+        except ValueError:
+            logger.warning(
+                "Giá trị không hợp lệ cho %s.%s, dùng mặc định: %s",
+                section,
+                key,
+                fallback,
+            )
+            return fallback
+
+    def update_general(self, general: GeneralOptions) -> None:
+        """Replace the ``[general]`` settings in both the cache and the parser."""
+        self.update_sections(
+            {
+                "general": {
+                    "download_dir": general.download_dir,
+                    "max_workers": str(general.max_workers),
+                    "check_for_updates": str(general.check_for_updates).lower(),
+                }
+            }
+        )
+
+    def update_sections(self, values: Dict[str, Dict[str, str]]) -> None:
+        """Merge raw INI values in one pass and refresh the cached views.
+
+        If the merged values cannot be parsed the touched sections are
+        restored, so ``flush`` never writes them out.
+        """
+        previous = {
+            section: dict(self.config[section])
+            for section in values
+            if self.config.has_section(section)
+        }
+        self.config.read_dict(values)
+        try:
+            self._rebuild_options_cache()
+        except Exception:
+            for section in values:
+                self.config.remove_section(section)
+            self.config.read_dict(previous)
+            self._rebuild_options_cache()
+            raise
+        self._dirty = True
 
     def create_default_config(self) -> None:
         self.config["general"] = {
             "download_dir": DEFAULT_DOWNLOAD_DIR,
-            "max_workers": "1",
+            "max_workers": str(DEFAULT_MAX_WORKERS),
             "check_for_updates": "true",
         }
 
@@ -48,6 +141,8 @@ class ConfigManager:
             "audio_quality": "192",
             "retry_count": "10",
             "sleep_interval": "3",
+            "streams_per_file": str(DEFAULT_STREAMS_PER_FILE),
+            "adaptive_concurrency": "true",
             "rate_limit": "",
             "download_thumbnails": "false",
             "download_subtitles": "false",
@@ -65,37 +160,51 @@ class ConfigManager:
 
     def save_config(self) -> None:
         try:
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, "w", encoding="utf-8") as config_file:
-                self.config.write(config_file)
+            buffer = io.StringIO()
+            self.config.write(buffer)
+            atomic_write(self.config_file, buffer.getvalue())
+            self._dirty = False
             logger.info("Đã lưu cấu hình vào %s", self.config_file)
         except Exception as exc:
             logger.error("Lỗi khi lưu cấu hình: %s", exc)
 
+    def flush(self) -> None:
+        """Write option changes made through the ``update_*`` methods."""
+        if self._dirty:
+            self.save_config()
+
     def get_download_options(self) -> DownloadOptions:
-        options = DownloadOptions()
+        """Return a fresh copy of the options parsed from the config."""
+        template = self._options_template
+        return replace(
+            template, subtitle_languages=list(template.subtitle_languages)
+        )
 
-        if "general" in self.config:
-            options.download_dir = self.config.get(
-                "general", "download_dir", fallback=DEFAULT_DOWNLOAD_DIR
-            )
-            options.max_workers = self.config.getint(
-                "general", "max_workers", fallback=1
-            )
+    def _read_download_options(self) -> DownloadOptions:
+        options = DownloadOptions(
+            download_dir=self.general.download_dir,
+            max_workers=self.general.max_workers,
+        )
 
         if "download" in self.config:
             download = self.config["download"]
             options.format_selector = download.get("format_selector", "best")
             options.merge_format = download.get("merge_format", "mp4")
             options.audio_quality = download.get("audio_quality", "192")
-            options.retry_count = download.getint("retry_count", fallback=10)
-            options.sleep_interval = download.getint("sleep_interval", fallback=3)
+            options.retry_count = self._getint("download", "retry_count", 10)
+            options.sleep_interval = self._getint("download", "sleep_interval", 3)
+            options.streams_per_file = self._getint(
+                "download", "streams_per_file", DEFAULT_STREAMS_PER_FILE
+            )
+            options.adaptive_concurrency = self._getboolean(
+                "download", "adaptive_concurrency", True
+            )
             options.rate_limit = download.get("rate_limit", "")
-            options.download_thumbnails = download.getboolean(
-                "download_thumbnails", fallback=False
+            options.download_thumbnails = self._getboolean(
+                "download", "download_thumbnails", False
             )
-            options.download_subtitles = download.getboolean(
-                "download_subtitles", fallback=False
+            options.download_subtitles = self._getboolean(
+                "download", "download_subtitles", False
             )
             subtitle_raw = download.get("subtitle_languages", "vi,en")
             options.subtitle_languages = [
@@ -104,67 +213,79 @@ class ConfigManager:
 
         if "authentication" in self.config:
             auth = self.config["authentication"]
-            if auth.getboolean("use_proxy", fallback=False):
+            if self._getboolean("authentication", "use_proxy", False):
                 options.proxy = auth.get("proxy", "")
-            options.use_cookies = auth.getboolean("use_cookies", fallback=False)
+            options.use_cookies = self._getboolean(
+                "authentication", "use_cookies", False
+            )
             options.cookies_file = auth.get("cookies_file", "")
 
         return options
 
-    def update_from_options(self, options: DownloadOptions) -> None:
-        self.config.setdefault("general", {})
-        self.config["general"]["download_dir"] = options.download_dir
-        self.config["general"]["max_workers"] = str(options.max_workers)
-
-        self.config.setdefault("download", {})
-        self.config["download"]["format_selector"] = options.format_selector
-        self.config["download"]["merge_format"] = options.merge_format
-        self.config["download"]["audio_quality"] = options.audio_quality
-        self.config["download"]["retry_count"] = str(options.retry_count)
-        self.config["download"]["sleep_interval"] = str(options.sleep_interval)
-        self.config["download"]["rate_limit"] = options.rate_limit
-        self.config["download"]["download_thumbnails"] = str(
-            options.download_thumbnails
-        ).lower()
-        self.config["download"]["download_subtitles"] = str(
-            options.download_subtitles
-        ).lower()
-        self.config["download"]["subtitle_languages"] = ",".join(
-            options.subtitle_languages
-        )
+    @staticmethod
+    def _option_values(options: DownloadOptions) -> Dict[str, Dict[str, str]]:
+        """Map options onto the INI sections and string values they persist as."""
+        return {
+            "general": {
+                "download_dir": options.download_dir,
+                "max_workers": str(options.max_workers),
+            },
+            "download": {
+                "format_selector": options.format_selector,
+                "merge_format": options.merge_format,
+                "audio_quality": options.audio_quality,
+                "retry_count": str(options.retry_count),
+                "sleep_interval": str(options.sleep_interval),
+                "streams_per_file": str(options.streams_per_file),
+                "adaptive_concurrency": str(options.adaptive_concurrency).lower(),
+                "rate_limit": options.rate_limit,
+                "download_thumbnails": str(options.download_thumbnails).lower(),
+                "download_subtitles": str(options.download_subtitles).lower(),
+                "subtitle_languages": ",".join(options.subtitle_languages),
+            },
+            "authentication": {
+                "use_proxy": str(bool(options.proxy)).lower(),
+                "proxy": options.proxy,
+                "use_cookies": str(options.use_cookies).lower(),
+                "cookies_file": options.cookies_file,
+            },
+        }
 
-        self.config.setdefault("authentication", {})
-        self.config["authentication"]["use_proxy"] = str(bool(options.proxy)).lower()
-        self.config["authentication"]["proxy"] = options.proxy
-        self.config["authentication"]["use_cookies"] = str(
-            options.use_cookies
-        ).lower()
-        self.config["authentication"]["cookies_file"] = options.cookies_file
+    def update_from_options(self, options: DownloadOptions) -> None:
+        changed = False
+        for section, values in self._option_values(options).items():
+            if section not in self.config:
+                self.config[section] = {}
+            current = self.config[section]
+            for key, value in values.items():
+                if current.get(key) != value:
+                    current[key] = value
+                    changed = True
 
-        self.save_config()
+        # Persisted lazily by flush(), either explicitly or at exit; running
+        # with unchanged options leaves the file untouched.
+        if changed:
+            self._dirty = True
+            self._rebuild_options_cache()
 
     def save_download_state(self, tasks: List[DownloadTask]) -> None:
         try:
             state = {
-                "timestamp": datetime.now().isoformat(),
-                "tasks": [],
+                "timestamp": time.time(),
+                "tasks": [
+                    {
+                        "url": task.url,
+                        "is_playlist": task.is_playlist,
+                        "index": task.index,
+                        "total": task.total,
+                        "progress": task.progress.percent,
+                    }
+                    for task in tasks
+                    if task.url and task.progress.status != "finished"
+                ],
             }
 
-            for task in tasks:
-                if task.url and task.progress.status != "finished":
-                    state["tasks"].append(
-                        {
-                            "url": task.url,
-                            "is_playlist": task.is_playlist,
-                            "index": task.index,
-                            "total": task.total,
-                            "progress": task.progress.percent,
-                        }
-                    )
-
-            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
-            with open(self.state_file, "w", encoding="utf-8") as state_file:
-                json.dump(state, state_file)
+            atomic_write(self.state_file, json_dumps(state))
 
             logger.info("Đã lưu trạng thái tải xuống vào %s", self.state_file)
         except Exception as exc:
@@ -172,17 +293,18 @@ class ConfigManager:
 
     def load_download_state(self) -> List[Dict[str, Any]]:
         try:
-            if os.path.exists(self.state_file):
-                with open(self.state_file, "r", encoding="utf-8") as state_file:
-                    state = json.load(state_file)
+            # The file is rewritten on every save, so its mtime tells whether
+            # it is stale without reading or parsing it.
+            if time.time() - os.stat(self.state_file).st_mtime > STATE_MAX_AGE:
+                logger.info("Trạng thái tải xuống quá cũ, bỏ qua.")
+                return []
 
-                timestamp = datetime.fromisoformat(state.get("timestamp", ""))
-                if (datetime.now() - timestamp).days > 7:
-                    logger.info("Trạng thái tải xuống quá cũ, bỏ qua.")
-                    return []
+            with open(self.state_file, "rb") as state_file:
+                state = json_loads(state_file.read())
 
-                logger.info("Đã tải trạng thái tải xuống từ %s", self.state_file)
-                return state.get("tasks", [])
+            logger.info("Đã tải trạng thái tải xuống từ %s", self.state_file)
+            return state.get("tasks", [])
+        except FileNotFoundError:
             return []
         except Exception as exc:
             logger.error("Lỗi khi tải trạng thái tải xuống: %s", exc)
@@ -8,11 +8,33 @@ VERSION = "2.0.0"
 
 CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".youtube_downloader_config.ini")
 STATE_FILE = os.path.join(os.path.expanduser("~"), ".youtube_downloader_state.json")
+VERSION_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".youtube_downloader_version_cache.json"
+)
 DEFAULT_DOWNLOAD_DIR = os.path.join(os.path.expanduser("~"), "Downloads", "YouTube")
 
+# Upper bound for parallel downloads accepted from the CLI and GUI. More
+# streams than this mostly earns per-IP throttling; YT_DL_MAX_WORKERS overrides it.
+try:
+    MAX_WORKERS_LIMIT = max(1, int(os.environ.get("YT_DL_MAX_WORKERS", "10")))
+except ValueError:
+    MAX_WORKERS_LIMIT = 10
+
+# Parallel fragment connections per video (yt-dlp's -N); more than this
+# mostly provokes server-side throttling.
+DEFAULT_STREAMS_PER_FILE = 4
+MAX_STREAMS_PER_FILE = 16
+
+# Downloads are I/O bound, so even single-core machines get two streams; the
+# default grows with the core count up to eight.
+DEFAULT_MAX_WORKERS = min(max(os.cpu_count() or 4, 2), 8, MAX_WORKERS_LIMIT)
+
 LOG_FILE = "youtube_downloader.log"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_MAX_BYTES = 5_000_000
+LOG_BACKUP_COUNT = 3
 
 YT_DLP_LATEST_VERSION_URL = (
     "https://api.github.com/repos/yt-dlp/yt-dlp/releases/latest"
 )
+VERSION_CHECK_TTL = 24 * 60 * 60
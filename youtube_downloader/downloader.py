@@ -5,11 +5,25 @@ from __future__ import annotations
 import copy
 import logging
 import os
+import re
 import threading
 import time
-import traceback
+from collections import OrderedDict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from dataclasses import replace
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 try:
     from yt_dlp import YoutubeDL  # type: ignore
@@ -19,6 +33,12 @@ except ImportError as exc:  # pragma: no cover
         "Vui lòng cài đặt bằng lệnh: pip install yt-dlp"
     ) from exc
 
+try:
+    # yt-dlp re-raises its own cancellation type even with ignoreerrors set.
+    from yt_dlp.utils import DownloadCancelled as _YtDlpCancelled  # type: ignore
+except ImportError:  # pragma: no cover - yt-dlp older than 2021.10
+    _YtDlpCancelled = Exception  # type: ignore[assignment,misc]
+
 from .config import ConfigManager
 from .models import (
     DownloadOptions,
@@ -33,10 +53,148 @@ logger = logging.getLogger(__name__)
 
 ProgressCallback = Callable[[DownloadTask], None]
 
+YOUTUBE_WATCH_URL = "https://www.youtube.com/watch?v={}"
+
+_PLAYLIST_RE = re.compile(r"/playlist\b|[?&#]list=")
+
+# Extracted metadata is reused for a while so analysing a URL and then
+# downloading it does not hit YouTube twice. Format URLs returned by yt-dlp
+# expire after a few hours, so entries are kept in memory only.
+METADATA_CACHE_SIZE = 64
+METADATA_CACHE_TTL = 10 * 60
+
+# yt-dlp reports progress every few KB; callbacks only need a few per second.
+PROGRESS_NOTIFY_BYTES = 256 * 1024
+PROGRESS_NOTIFY_INTERVAL = 0.2
+
+# Adaptive concurrency: throughput is compared over windows of this many
+# seconds, and a window must beat the previous one by this factor to open
+# another download slot.
+CONCURRENCY_WINDOW = 10.0
+CONCURRENCY_GAIN = 1.05
+
+# Failures that mean "too many connections" rather than a broken video.
+_THROTTLE_ERROR_RE = re.compile(
+    r"timed? ?out|HTTP Error 429|Too Many Requests", re.IGNORECASE
+)
+
+
+# Selector tokens yt-dlp resolves itself; anything else is a format id.
+_FORMAT_KEYWORDS = frozenset(
+    {
+        "all", "mergeall",
+        "b", "best", "bestvideo", "bestaudio", "bv", "ba",
+        "w", "worst", "worstvideo", "worstaudio", "wv", "wa",
+        "3gp", "aac", "flv", "m4a", "mp3", "mp4", "ogg", "wav", "webm",
+    }
+)
+
+
+def _format_available(part: str, format_ids: AbstractSet[str]) -> bool:
+    token = part.split("[", 1)[0]
+    return (
+        not token
+        or token in format_ids
+        or token in _FORMAT_KEYWORDS
+        or token.rstrip("*.0123456789") in _FORMAT_KEYWORDS
+    )
+
+
+def _pick_format(selector: str, format_ids: Optional[AbstractSet[str]]) -> str:
+    """Resolve ``selector`` against the formats known before downloading.
+
+    Alternatives naming format ids missing from ``format_ids`` are dropped
+    and ``best`` is kept as the last resort, so yt-dlp falls back within a
+    single run instead of failing with "requested format is not available".
+    """
+    if "(" in selector or "," in selector:
+        alternatives = [selector]
+    else:
+        alternatives = [
+            alt
+            for alt in (a.strip() for a in selector.split("/"))
+            if alt
+            and (
+                format_ids is None
+                or all(_format_available(p, format_ids) for p in alt.split("+"))
+            )
+        ]
+    if "best" not in alternatives:
+        alternatives.append("best")
+    return "/".join(alternatives)
+
+
+class DownloadCancelled(_YtDlpCancelled):
+    """Raised from the progress hook to abort a download the user cancelled."""
+
+
+class ConcurrencyController:
+    """AIMD limit on how many downloads of a parallel batch run at once.
+
+    Workers take a slot with ``acquire`` before downloading. Every
+    ``CONCURRENCY_WINDOW`` seconds the batch throughput is compared with the
+    previous window: a clear improvement opens one more slot (up to
+    ``maximum``), while a timeout or throttling error halves the limit.
+    """
+
+    def __init__(self, initial: int, maximum: int) -> None:
+        self.maximum = max(1, maximum)
+        self.current = min(max(1, initial), self.maximum)
+        self._active = 0
+        self._cond = threading.Condition()
+        self._window_start = time.monotonic()
+        self._window_bytes = 0
+        self._last_rate = 0.0
+
+    def acquire(self, cancel_event: threading.Event) -> bool:
+        """Wait for a free slot; False if ``cancel_event`` is set meanwhile."""
+        with self._cond:
+            while self._active >= self.current and not cancel_event.is_set():
+                self._cond.wait(0.5)
+            if cancel_event.is_set():
+                return False
+            self._active += 1
+            return True
+
+    def release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def on_bytes(self, count: int) -> None:
+        """Account downloaded bytes and adjust the limit once per window."""
+        with self._cond:
+            self._window_bytes += count
+            now = time.monotonic()
+            elapsed = now - self._window_start
+            if elapsed < CONCURRENCY_WINDOW:
+                return
+
+            rate = self._window_bytes / elapsed
+            improved = rate > self._last_rate * CONCURRENCY_GAIN
+            if improved and self.current < self.maximum:
+                self.current += 1
+                self._cond.notify()
+                logger.info("Tăng số luồng tải song song lên %s", self.current)
+            self._last_rate = rate
+            self._window_start = now
+            self._window_bytes = 0
+
+    def on_timeout(self) -> None:
+        """Halve the limit after the server timed out or throttled us."""
+        with self._cond:
+            if self.current > 1:
+                self.current //= 2
+                logger.info("Giảm số luồng tải song song xuống %s", self.current)
+            # Probe upwards again from the reduced level.
+            self._last_rate = 0.0
+            self._window_start = time.monotonic()
+            self._window_bytes = 0
+
 
 def copy_download_options(options: DownloadOptions) -> DownloadOptions:
-    """Deep-copy helper to duplicate download options safely."""
-    return copy.deepcopy(options)
+    """Copy download options; the only mutable field is the language list."""
+    return replace(options, subtitle_languages=list(options.subtitle_languages))
 
 
 class YouTubeDownloader:
@@ -45,26 +203,116 @@ class YouTubeDownloader:
     def __init__(self, config_manager: Optional[ConfigManager] = None):
         self.config_manager = config_manager or ConfigManager()
         self.default_options = self.config_manager.get_download_options()
-        self.active_tasks: List[DownloadTask] = []
+        # Keyed by id(task): insertion-ordered with O(1) removal.
+        self.active_tasks: Dict[int, DownloadTask] = {}
         self.completed_tasks: List[DownloadTask] = []
         self.failed_tasks: List[DownloadTask] = []
         self.progress_callbacks: List[ProgressCallback] = []
+        # Set by cancel_all_downloads; checked between tasks and on every
+        # progress tick so running downloads stop at the next chunk.
+        self.cancel_event = threading.Event()
         self.executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers = 0
+        # Set while an adaptive parallel batch runs; fed from progress_hook.
+        self._concurrency: Optional[ConcurrencyController] = None
         self._tasks_lock = threading.Lock()
+        self._task_by_url: Dict[str, DownloadTask] = {}
+        self._task_by_filename: Dict[str, DownloadTask] = {}
+        self._basename_cache: Dict[str, str] = {}
+        self._ensured_dirs: Set[str] = set()
+        self._metadata_cache: "OrderedDict[Tuple[str, bool], Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._metadata_lock = threading.Lock()
+        # Idle metadata-only YoutubeDL instances keyed by extract_formats.
+        self._idle_extractors: Dict[bool, List[YoutubeDL]] = {True: [], False: []}
+        # Progress events are delivered in order by a dispatcher thread.
+        # Each entry is [id(task), snapshot]; consecutive "downloading" ticks
+        # of a task collapse into the still-queued entry.
+        self._progress_events: Deque[List[Any]] = deque()
+        self._pending_ticks: Dict[int, List[Any]] = {}
+        self._progress_cond = threading.Condition()
+        self._dispatching = False
+        self._dispatcher: Optional[threading.Thread] = None
 
     def add_progress_callback(self, callback: ProgressCallback) -> None:
         self.progress_callbacks.append(callback)
 
     def notify_progress(self, task: DownloadTask) -> None:
-        for callback in list(self.progress_callbacks):
-            try:
-                callback(task)
-            except Exception as exc:
-                logger.error("Lỗi khi gọi callback tiến trình: %s", exc)
+        """Queue ``task``'s current progress for the callbacks.
+
+        Download threads never wait on slow callbacks (e.g. a busy Tk
+        loop): while an update is still queued, newer "downloading" ticks
+        of the same task replace it. Status changes are never dropped.
+        """
+        if not self.progress_callbacks:
+            return
+
+        snapshot = copy.copy(task)
+        snapshot.progress = copy.copy(task.progress)
+        task_id = id(task)
+
+        with self._progress_cond:
+            if snapshot.progress.status == "downloading":
+                pending = self._pending_ticks.get(task_id)
+                if pending is not None:
+                    pending[1] = snapshot
+                    return
+                event = [task_id, snapshot]
+                self._pending_ticks[task_id] = event
+            else:
+                self._pending_ticks.pop(task_id, None)
+                event = [task_id, snapshot]
+
+            self._progress_events.append(event)
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch_progress, name="progress", daemon=True
+                )
+                self._dispatcher.start()
+            self._progress_cond.notify_all()
+
+    def _dispatch_progress(self) -> None:
+        while True:
+            with self._progress_cond:
+                while not self._progress_events:
+                    self._progress_cond.wait()
+                event = self._progress_events.popleft()
+                if self._pending_ticks.get(event[0]) is event:
+                    del self._pending_ticks[event[0]]
+                self._dispatching = True
+
+            for callback in list(self.progress_callbacks):
+                try:
+                    callback(event[1])
+                except Exception as exc:
+                    logger.error("Lỗi khi gọi callback tiến trình: %s", exc)
+
+            with self._progress_cond:
+                self._dispatching = False
+                self._progress_cond.notify_all()
+
+    def flush_progress(self) -> None:
+        """Block until every queued progress update has been delivered."""
+        with self._progress_cond:
+            while self._progress_events or self._dispatching:
+                self._progress_cond.wait()
 
     def progress_hook(self, data: Dict[str, Any]) -> None:
+        # Checked before the task lookup: cancel_all_downloads clears the
+        # task indexes while workers are still inside yt-dlp.
+        if self.cancel_event.is_set():
+            raise DownloadCancelled("Đã hủy bởi người dùng")
+
         filename = data.get("filename", "")
-        basename = os.path.basename(filename)
+        status = data.get("status")
+
+        basename = self._basename_cache.get(filename)
+        if basename is None:
+            basename = os.path.basename(filename)
+            self._basename_cache[filename] = basename
+        if status in ("finished", "error"):
+            self._basename_cache.pop(filename, None)
 
         task: Optional[DownloadTask] = None
         info_dict = data.get("info_dict") or {}
@@ -76,39 +324,62 @@ class YouTubeDownloader:
 
         with self._tasks_lock:
             if candidate_url:
-                for candidate in self.active_tasks:
-                    if candidate.url == candidate_url:
-                        task = candidate
-                        break
+                task = self._task_by_url.get(candidate_url)
 
             if task is None:
-                for candidate in self.active_tasks:
-                    if candidate.progress.filename and candidate.progress.filename == basename:
-                        task = candidate
-                        break
+                task = self._task_by_filename.get(basename)
 
             if task is None:
-                for candidate in self.active_tasks:
+                for candidate in self.active_tasks.values():
                     if not candidate.progress.filename:
                         task = candidate
                         break
 
+            if task is not None:
+                if status in ("finished", "error"):
+                    if self._task_by_filename.get(basename) is task:
+                        del self._task_by_filename[basename]
+                elif basename:
+                    self._task_by_filename[basename] = task
+
         if task is None:
             logger.warning("Không tìm thấy task cho file: %s", filename)
             return
 
         progress = task.progress
 
-        status = data.get("status")
         if status == "downloading":
+            downloaded_bytes = data.get("downloaded_bytes") or 0
+            now = time.monotonic()
+            if (
+                progress.filename == basename
+                and downloaded_bytes - progress._last_notify_bytes < PROGRESS_NOTIFY_BYTES
+                and now - progress._last_notify_time < PROGRESS_NOTIFY_INTERVAL
+            ):
+                return
+            progress._last_notify_bytes = downloaded_bytes
+            progress._last_notify_time = now
+
+            controller = self._concurrency
+            if controller is not None:
+                # A new file (e.g. the audio stream after the video) restarts at 0.
+                previous = progress.bytes_downloaded
+                if progress.filename != basename:
+                    previous = 0
+                controller.on_bytes(max(0, downloaded_bytes - previous))
+
             progress.filename = basename
             progress.status = "downloading"
-            percent_str = data.get("_percent_str", "0")
-            percent_str = clean_ansi(percent_str).replace("%", "").strip()
-            progress.percent = float(percent_str) if "_percent_str" in data else 0
+            # Recent yt-dlp versions expose the raw float; older ones only
+            # provide the coloured display string.
+            percent = data.get("_percent")
+            if percent is None and "_percent_str" in data:
+                percent_str = clean_ansi(data["_percent_str"]).replace("%", "").strip()
+                percent = float(percent_str)
+            progress.percent = percent or 0
             progress.speed = data.get("_speed_str", "N/A")
             progress.eta = data.get("_eta_str", "N/A")
-            progress.bytes_downloaded = data.get("downloaded_bytes", 0)
+            progress.bytes_downloaded = downloaded_bytes
             progress.total_bytes = data.get("total_bytes", 0)
 
             self.notify_progress(task)
@@ -126,20 +397,81 @@ class YouTubeDownloader:
             self.notify_progress(task)
             logger.error("Lỗi khi tải: %s", progress.error_message)
 
+    def postprocessor_hook(self, _data: Dict[str, Any]) -> None:
+        """Stop before (or between) post-processing steps once cancelled."""
+        if self.cancel_event.is_set():
+            raise DownloadCancelled("Đã hủy bởi người dùng")
+
     def extract_info(self, url: str, extract_formats: bool = True) -> Dict[str, Any]:
-        options = {
-            "skip_download": True,
-            "quiet": True,
-            "no_warnings": True,
-            "extract_flat": not extract_formats,
-        }
+        key = (url, extract_formats)
+        now = time.monotonic()
+        with self._metadata_lock:
+            cached = self._metadata_cache.get(key)
+            if cached is not None and now - cached[0] < METADATA_CACHE_TTL:
+                self._metadata_cache.move_to_end(key)
+                return cached[1]
+
+        ydl = self._acquire_extractor(extract_formats)
+        try:
+            info = ydl.extract_info(url, download=False)
+        finally:
+            self._release_extractor(extract_formats, ydl)
+
+        with self._metadata_lock:
+            self._metadata_cache[key] = (now, info)
+            self._metadata_cache.move_to_end(key)
+            while len(self._metadata_cache) > METADATA_CACHE_SIZE:
+                self._metadata_cache.popitem(last=False)
+        return info
+
+    def _acquire_extractor(self, extract_formats: bool) -> YoutubeDL:
+        """Check out an idle metadata-only YoutubeDL, creating one if needed.
+
+        Building a YoutubeDL loads every extractor, so instances are pooled
+        and handed back via ``_release_extractor``; each one is used by a
+        single thread at a time since they are not thread-safe.
+        """
+        with self._metadata_lock:
+            idle = self._idle_extractors[extract_formats]
+            if idle:
+                return idle.pop()
+        return YoutubeDL(
+            {
+                "skip_download": True,
+                "quiet": True,
+                "no_warnings": True,
+                "extract_flat": not extract_formats,
+            }
+        )
+
+    def _release_extractor(self, extract_formats: bool, ydl: YoutubeDL) -> None:
+        with self._metadata_lock:
+            self._idle_extractors[extract_formats].append(ydl)
+
+    @staticmethod
+    def warm_up() -> None:
+        """Pay yt-dlp's one-off extractor initialisation ahead of first use."""
+        try:
+            YoutubeDL({"quiet": True}).close()
+        except Exception as exc:
+            logger.debug("Lỗi khi khởi động trước yt-dlp: %s", exc)
+
+    def refresh_metadata(self, url: str) -> None:
+        """Forget cached metadata for ``url`` so the next lookup re-extracts."""
+        with self._metadata_lock:
+            for extract_formats in (True, False):
+                self._metadata_cache.pop((url, extract_formats), None)
 
-        with YoutubeDL(options) as ydl:
-            return ydl.extract_info(url, download=False)
+    def ensure_dir(self, path: str) -> None:
+        """Create ``path`` once; later calls for the same path skip the filesystem."""
+        if path in self._ensured_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._ensured_dirs.add(path)
 
     @staticmethod
     def is_playlist(url: str) -> bool:
-        return "playlist" in url or "list=" in url
+        return _PLAYLIST_RE.search(url) is not None
 
     def get_video_info(self, url: str) -> VideoInfo:
         try:
@@ -157,35 +489,78 @@ class YouTubeDownloader:
             logger.error("Lỗi khi lấy thông tin playlist: %s", exc)
             raise
 
+    @staticmethod
+    def _video_urls_from_entries(entries: Iterable[Dict[str, Any]]) -> List[str]:
+        watch_url = YOUTUBE_WATCH_URL.format
+        return [
+            entry.get("url") or watch_url(entry["id"])
+            for entry in entries
+            if entry and (entry.get("url") or entry.get("id"))
+        ]
+
     def get_all_video_urls_from_playlist(self, url: str) -> List[str]:
         try:
             info = self.extract_info(url, extract_formats=False)
-            video_urls = []
-            for entry in info.get("entries", []):
-                if not entry:
-                    continue
-                if entry.get("url"):
-                    video_urls.append(entry["url"])
-                elif entry.get("id"):
-                    video_urls.append(f"https://www.youtube.com/watch?v={entry['id']}")
-            return video_urls
+            return self._video_urls_from_entries(info.get("entries") or [])
         except Exception as exc:
             logger.error("Lỗi khi lấy danh sách video từ playlist: %s", exc)
             raise
 
-    def _finalize_success(self, task: DownloadTask) -> None:
-        with self._tasks_lock:
-            if task in self.active_tasks:
-                self.active_tasks.remove(task)
-            self.completed_tasks.append(task)
+    def _extract_playlist_bundle(self, url: str) -> Tuple[PlaylistInfo, List[str]]:
+        """Return playlist metadata and its video URLs from one extraction."""
+        try:
+            info = self.extract_info(url, extract_formats=False)
+            video_urls = self._video_urls_from_entries(info.get("entries") or [])
+            playlist_info = PlaylistInfo.from_yt_dlp_info(info)
+            if not playlist_info.video_count:
+                playlist_info.video_count = len(video_urls)
+            return playlist_info, video_urls
+        except Exception as exc:
+            logger.error("Lỗi khi lấy thông tin playlist: %s", exc)
+            raise
 
-    def _finalize_failure(self, task: DownloadTask) -> None:
+    def _track_tasks(self, tasks: Iterable[DownloadTask]) -> None:
+        """Register tasks as active; caller must hold ``_tasks_lock``."""
+        for task in tasks:
+            self.active_tasks[id(task)] = task
+            self._task_by_url.setdefault(task.url, task)
+
+    def _untrack_task(self, task: DownloadTask) -> None:
+        """Drop a task from the active set; caller must hold ``_tasks_lock``."""
+        self.active_tasks.pop(id(task), None)
+        if self._task_by_url.get(task.url) is task:
+            del self._task_by_url[task.url]
+        filename = task.progress.filename
+        if filename and self._task_by_filename.get(filename) is task:
+            del self._task_by_filename[filename]
+
+    def _record_results(self, results: Iterable[Tuple[DownloadTask, bool]]) -> None:
+        """Move finished tasks into the completed/failed lists.
+
+        Only the thread driving a batch calls this, so download workers never
+        contend on the shared task lists.
+        """
         with self._tasks_lock:
-            if task in self.active_tasks:
-                self.active_tasks.remove(task)
-            self.failed_tasks.append(task)
+            for task, success in results:
+                if id(task) not in self.active_tasks:
+                    # Already settled, e.g. marked failed by a cancel.
+                    continue
+                self._untrack_task(task)
+                if success:
+                    self.completed_tasks.append(task)
+                else:
+                    self.failed_tasks.append(task)
+
+    def download_single_video(
+        self, task: DownloadTask, fetched: Optional[threading.Event] = None
+    ) -> bool:
+        """Download one task and report whether it succeeded.
 
-    def download_single_video(self, task: DownloadTask) -> bool:
+        The task is left in ``active_tasks``; the caller records the outcome
+        with ``_record_results``. ``fetched`` is set once yt-dlp moves on to
+        post-processing (merge, MP3 conversion, ...) or the call ends,
+        whichever happens first.
+        """
         if task.index > 0 and task.total > 0:
             logger.info("[%s/%s] Đang tải video: %s", task.index, task.total, task.url)
         else:
@@ -195,7 +570,19 @@ class YouTubeDownloader:
         self.notify_progress(task)
 
         options = task.options.to_yt_dlp_options()
+        format_ids = None
+        if task.video_info and task.video_info.formats:
+            format_ids = {f.format_id for f in task.video_info.formats}
+        requested = options["format"]
+        options["format"] = _pick_format(requested, format_ids)
+        if options["format"].split("/", 1)[0] != requested.split("/", 1)[0]:
+            logger.info(
+                "Định dạng yêu cầu không có sẵn. Dùng định dạng tốt nhất..."
+            )
         options["progress_hooks"] = [self.progress_hook]
+        options["postprocessor_hooks"] = [self.postprocessor_hook]
+        if fetched is not None:
+            options["postprocessor_hooks"].append(lambda _data: fetched.set())
 
         try:
             with YoutubeDL(options) as ydl:
@@ -204,47 +591,25 @@ class YouTubeDownloader:
             task.progress.status = "finished"
             task.progress.percent = 100.0
             self.notify_progress(task)
-            self._finalize_success(task)
             return True
         except Exception as exc:
             error_msg = str(exc)
             logger.error("Lỗi khi tải video: %s", error_msg)
 
-            if "requested format is not available" in error_msg:
-                logger.info(
-                    "Định dạng yêu cầu không có sẵn. Thử lại với định dạng tốt nhất..."
-                )
-                options["format"] = "best"
-                try:
-                    with YoutubeDL(options) as ydl:
-                        ydl.download([task.url])
-
-                    task.progress.status = "finished"
-                    task.progress.percent = 100.0
-                    self.notify_progress(task)
-                    self._finalize_success(task)
-                    return True
-                except Exception as retry_exc:
-                    error_msg = str(retry_exc)
-                    logger.error("Vẫn không thể tải: %s", error_msg)
-
             task.progress.status = "error"
             task.progress.error_message = error_msg
             self.notify_progress(task)
-            self._finalize_failure(task)
             return False
 
     def download_playlist(self, url: str, options: DownloadOptions) -> bool:
         try:
-            playlist_info = self.get_playlist_info(url)
+            playlist_info, video_urls = self._extract_playlist_bundle(url)
             logger.info(
                 "Đã tìm thấy playlist: %s với %s video",
                 playlist_info.title,
                 playlist_info.video_count,
             )
 
-            video_urls = self.get_all_video_urls_from_playlist(url)
-
             if not video_urls:
                 logger.error("Không tìm thấy video nào trong playlist.")
                 return False
@@ -252,7 +617,7 @@ class YouTubeDownloader:
             playlist_dir = os.path.join(
                 options.download_dir, sanitize(playlist_info.title)
             )
-            os.makedirs(playlist_dir, exist_ok=True)
+            self.ensure_dir(playlist_dir)
 
             playlist_options = copy_download_options(options)
             playlist_options.output_template = os.path.join(
@@ -272,71 +637,172 @@ class YouTubeDownloader:
             ]
 
             with self._tasks_lock:
-                self.active_tasks.extend(tasks)
+                self._track_tasks(tasks)
 
             if options.max_workers > 1:
-                return self._download_parallel(tasks, options.max_workers, options.sleep_interval)
+                return self._download_parallel(
+                    tasks,
+                    options.max_workers,
+                    options.sleep_interval,
+                    adaptive=options.adaptive_concurrency,
+                )
 
             return self._download_sequential(tasks, options.sleep_interval)
         except Exception as exc:
-            logger.error("Lỗi khi tải playlist: %s", exc)
-            traceback.print_exc()
+            logger.exception("Lỗi khi tải playlist: %s", exc)
             return False
 
     def _download_sequential(
         self, tasks: Iterable[DownloadTask], sleep_interval: int
     ) -> bool:
+        """Download tasks one at a time, overlapping post-processing.
+
+        Each task runs in a worker thread. As soon as its files are fetched
+        the next download starts, so ffmpeg work on the previous video runs
+        alongside the next network transfer. At most one task is ever
+        post-processing while another downloads.
+        """
         tasks_list = list(tasks)
         success_count = 0
+        previous: Optional[Tuple[DownloadTask, threading.Thread, List[bool]]] = None
 
         for idx, task in enumerate(tasks_list):
             if idx > 0:
                 wait_time = min(sleep_interval, 1 + idx // 20)
                 logger.info("Chờ %s giây trước khi tải video tiếp theo...", wait_time)
-                time.sleep(wait_time)
+                self.cancel_event.wait(wait_time)
+            if self.cancel_event.is_set():
+                break
 
-            if self.download_single_video(task):
-                success_count += 1
+            fetched = threading.Event()
+            current = self._start_pipelined_download(task, fetched)
+            # Short timeouts keep the main thread responsive to Ctrl+C.
+            while not fetched.wait(0.5):
+                pass
 
+            if previous is not None:
+                success_count += self._join_pipelined_download(previous)
+            previous = current
+
+        if previous is not None:
+            success_count += self._join_pipelined_download(previous)
+
+        self.flush_progress()
         logger.info("Đã tải thành công %s/%s video", success_count, len(tasks_list))
         return success_count > 0
 
-    def _download_parallel(
-        self, tasks: List[DownloadTask], max_workers: int, sleep_interval: int
-    ) -> bool:
-        success_count = 0
+    def _start_pipelined_download(
+        self, task: DownloadTask, fetched: threading.Event
+    ) -> Tuple[DownloadTask, threading.Thread, List[bool]]:
+        result: List[bool] = []
 
-        if self.executor is None or self.executor._shutdown:
-            self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        def run() -> None:
+            try:
+                result.append(self.download_single_video(task, fetched))
+            finally:
+                fetched.set()
+
+        worker = threading.Thread(target=run, name="download", daemon=True)
+        worker.start()
+        return task, worker, result
+
+    def _join_pipelined_download(
+        self, pending: Tuple[DownloadTask, threading.Thread, List[bool]]
+    ) -> int:
+        task, worker, result = pending
+        while worker.is_alive():
+            worker.join(0.5)
+        success = bool(result and result[0])
+        self._record_results([(task, success)])
+        return int(success)
+
+    def _get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        """Return the shared worker pool, resizing it if ``max_workers`` changed."""
+        if self.executor is not None and self._executor_workers != max_workers:
+            self.executor.shutdown(wait=False)
+            self.executor = None
 
-        batch_size = min(max_workers, 10)
-        task_batches = [tasks[i : i + batch_size] for i in range(0, len(tasks), batch_size)]
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="download"
+            )
+            self._executor_workers = max_workers
+        return self.executor
 
-        for batch_index, batch in enumerate(task_batches):
-            if batch_index > 0:
-                logger.info(
-                    "Chờ %s giây trước khi tải batch tiếp theo...",
-                    sleep_interval,
-                )
-                time.sleep(sleep_interval)
+    def _download_with_delay(self, task: DownloadTask, delay: float) -> bool:
+        if delay:
+            self.cancel_event.wait(delay)
+        if self.cancel_event.is_set():
+            return False
 
-            futures = [self.executor.submit(self.download_single_video, task) for task in batch]
+        controller = self._concurrency
+        if controller is None:
+            return self.download_single_video(task)
 
-            for future in as_completed(futures):
-                try:
-                    if future.result():
-                        success_count += 1
-                except Exception as exc:
-                    logger.error("Lỗi khi tải song song: %s", exc)
+        if not controller.acquire(self.cancel_event):
+            return False
+        try:
+            success = self.download_single_video(task)
+        finally:
+            controller.release()
+        if not success and _THROTTLE_ERROR_RE.search(task.progress.error_message):
+            controller.on_timeout()
+        return success
+
+    def _download_parallel(
+        self,
+        tasks: List[DownloadTask],
+        max_workers: int,
+        sleep_interval: int,
+        adaptive: bool = False,
+    ) -> bool:
+        """Download tasks on the worker pool.
+
+        With ``adaptive`` a ``ConcurrencyController`` capped at
+        ``max_workers`` decides how many of the pool's threads may download
+        at any moment, backing off when the server throttles.
+        """
+        success_count = 0
 
+        if adaptive:
+            self._concurrency = ConcurrencyController(max_workers, max_workers)
+        executor = self._get_executor(max_workers)
+
+        # Fan every task out at once and let the pool bound concurrency, so a
+        # slow video no longer holds back a whole batch. Only the first wave
+        # starts immediately; later tasks pause inside their worker to keep
+        # per-stream request pacing similar to the sequential path.
+        futures = {
+            executor.submit(
+                self._download_with_delay,
+                task,
+                0 if idx < max_workers else sleep_interval,
+            ): task
+            for idx, task in enumerate(tasks)
+        }
+
+        # Workers only return their status; this loop is the single place
+        # that moves tasks between the shared lists.
+        for future in as_completed(futures):
+            try:
+                success = bool(future.result())
+            except Exception as exc:
+                logger.error("Lỗi khi tải song song: %s", exc)
+                success = False
+            success_count += success
+            self._record_results([(futures[future], success)])
+
+        self._concurrency = None
+        self.flush_progress()
         logger.info("Đã tải thành công %s/%s video", success_count, len(tasks))
         return success_count > 0
 
     def download(self, url: str, options: Optional[DownloadOptions] = None) -> bool:
         options = options or self.default_options
+        self.cancel_event.clear()
 
         try:
-            os.makedirs(options.download_dir, exist_ok=True)
+            self.ensure_dir(options.download_dir)
 
             if self.is_playlist(url):
                 return self.download_playlist(url, options)
@@ -348,12 +814,14 @@ class YouTubeDownloader:
                 task = DownloadTask(url=url, options=options)
 
             with self._tasks_lock:
-                self.active_tasks.append(task)
+                self._track_tasks([task])
 
-            return self.download_single_video(task)
+            success = self.download_single_video(task)
+            self._record_results([(task, success)])
+            self.flush_progress()
+            return success
         except Exception as exc:
-            logger.error("Lỗi khi tải: %s", exc)
-            traceback.print_exc()
+            logger.exception("Lỗi khi tải: %s", exc)
             return False
 
     def resume_downloads(self) -> bool:
@@ -362,47 +830,29 @@ class YouTubeDownloader:
             logger.info("Không có tải xuống nào cần tiếp tục.")
             return False
 
+        self.cancel_event.clear()
         options = self.default_options
-        tasks: List[DownloadTask] = []
+        entries = [data for data in tasks_data if data.get("url")]
 
-        for data in tasks_data:
-            url = data.get("url")
-            if not url:
-                continue
+        # Metadata lookups are independent network round-trips; run them on
+        # the download pool rather than one after another.
+        executor = self._get_executor(options.max_workers)
+        infos = list(executor.map(self._fetch_resume_metadata, entries))
 
-            is_playlist = data.get("is_playlist", False)
-            index = data.get("index", 0)
-            total = data.get("total", 0)
-
-            if is_playlist:
-                try:
-                    playlist_info = self.get_playlist_info(url)
-                    task = DownloadTask(
-                        url=url,
-                        options=options,
-                        index=index,
-                        total=total,
-                        is_playlist=True,
-                        playlist_info=playlist_info,
-                    )
-                except Exception:
-                    task = DownloadTask(
-                        url=url,
-                        options=options,
-                        index=index,
-                        total=total,
-                        is_playlist=True,
-                    )
+        tasks: List[DownloadTask] = []
+        for data, info in zip(entries, infos):
+            url = data["url"]
+            if data.get("is_playlist", False):
+                task = DownloadTask(
+                    url=url,
+                    options=options,
+                    index=data.get("index", 0),
+                    total=data.get("total", 0),
+                    is_playlist=True,
+                    playlist_info=info,
+                )
             else:
-                try:
-                    video_info = self.get_video_info(url)
-                    task = DownloadTask(
-                        url=url,
-                        options=options,
-                        video_info=video_info,
-                    )
-                except Exception:
-                    task = DownloadTask(url=url, options=options)
+                task = DownloadTask(url=url, options=options, video_info=info)
 
             tasks.append(task)
 
@@ -413,27 +863,48 @@ class YouTubeDownloader:
         logger.info("Tiếp tục %s tải xuống đã bị gián đoạn.", len(tasks))
 
         with self._tasks_lock:
-            self.active_tasks.extend(tasks)
+            self._track_tasks(tasks)
 
         if options.max_workers > 1:
-            return self._download_parallel(tasks, options.max_workers, options.sleep_interval)
+            return self._download_parallel(
+                tasks,
+                options.max_workers,
+                options.sleep_interval,
+                adaptive=options.adaptive_concurrency,
+            )
 
         return self._download_sequential(tasks, options.sleep_interval)
 
+    def _fetch_resume_metadata(
+        self, data: Dict[str, Any]
+    ) -> Optional[Union[VideoInfo, PlaylistInfo]]:
+        try:
+            if data.get("is_playlist", False):
+                return self.get_playlist_info(data["url"])
+            return self.get_video_info(data["url"])
+        except Exception:
+            return None
+
     def cancel_all_downloads(self) -> None:
-        self.config_manager.save_download_state(self.active_tasks)
+        self.cancel_event.set()
+        with self._tasks_lock:
+            pending = list(self.active_tasks.values())
+        self.config_manager.save_download_state(pending)
 
         if self.executor:
             self.executor.shutdown(wait=False)
             self.executor = None
 
         with self._tasks_lock:
-            for task in self.active_tasks:
+            for task in self.active_tasks.values():
                 task.progress.status = "error"
                 task.progress.error_message = "Đã hủy bởi người dùng"
                 self.failed_tasks.append(task)
 
             self.active_tasks.clear()
+            self._task_by_url.clear()
+            self._task_by_filename.clear()
+            self._basename_cache.clear()
 
         logger.info("Đã hủy tất cả các tải xuống.")
 
@@ -441,3 +912,15 @@ class YouTubeDownloader:
         if self.executor:
             self.executor.shutdown(wait=True)
             self.executor = None
+
+        with self._metadata_lock:
+            extractors = [
+                ydl for idle in self._idle_extractors.values() for ydl in idle
+            ]
+            for idle in self._idle_extractors.values():
+                idle.clear()
+        for ydl in extractors:
+            try:
+                ydl.close()
+            except Exception as exc:
+                logger.debug("Lỗi khi đóng YoutubeDL: %s", exc)
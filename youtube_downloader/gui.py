@@ -2,47 +2,244 @@
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
+import re
 import sys
 import threading
-import traceback
-from typing import Dict, Optional
-
-try:
-    import tkinter as tk
-    from tkinter import filedialog, messagebox, scrolledtext, ttk
-
-    GUI_AVAILABLE = True
-except ImportError:  # pragma: no cover - environments without tkinter
-    tk = None  # type: ignore[assignment]
-    ttk = None  # type: ignore[assignment]
-    scrolledtext = None  # type: ignore[assignment]
-    filedialog = None  # type: ignore[assignment]
-    messagebox = None  # type: ignore[assignment]
-    GUI_AVAILABLE = False
+import weakref
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple, Union
+
+# tkinter is imported on first GUI use so CLI start-up does not pay for it.
+GUI_AVAILABLE = importlib.util.find_spec("tkinter") is not None
+
+tk = None  # type: ignore[assignment]
+ttk = None  # type: ignore[assignment]
+scrolledtext = None  # type: ignore[assignment]
+filedialog = None  # type: ignore[assignment]
+messagebox = None  # type: ignore[assignment]
 
 from .config import ConfigManager
-from .constants import DEFAULT_DOWNLOAD_DIR, STATE_FILE, VERSION
+from .constants import DEFAULT_DOWNLOAD_DIR, MAX_WORKERS_LIMIT, STATE_FILE, VERSION
 from .downloader import YouTubeDownloader
-from .models import DownloadOptions, DownloadTask
+from .models import (
+    DownloadOptions,
+    DownloadTask,
+    GeneralOptions,
+    PlaylistInfo,
+    VideoInfo,
+)
 from .theme import ColorTheme, ModernStyle
-from .utils import format_duration
+from .utils import format_count, format_duration
 from .versioning import VersionChecker, yt_dlp_version
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_MODES = (
+    ("🎵 Audio (MP3)", "1"),
+    ("🎥 Video (không audio)", "2"),
+    ("🎞️ Video + Audio (MP4)", "3"),
+    ("🧩 Format cụ thể", "4"),
+)
+
+# Cheap shape check so typos are rejected before yt-dlp is involved.
+YOUTUBE_URL_RE = re.compile(
+    r"^(?:https?://)?(?:(?:www|m|music)\.)?(?:youtube\.com|youtu\.be)/", re.IGNORECASE
+)
+
+# Progress rows are repainted at most this often (milliseconds).
+PROGRESS_REFRESH_MS = 100
+
+_HELP_CONTENT = """# HƯỚNG DẪN SỬ DỤNG YOUTUBE DOWNLOADER PRO
+
+## Giới thiệu
+YouTube downloader Pro là công cụ tải video/audio từ YouTube với nhiều tính năng nâng cao. Ứng dụng hỗ trợ tải video đơn lẻ hoặc playlist với nhiều tùy chọn định dạng khác nhau.
+
+## Các bước cơ bản
+1. Nhập URL video hoặc playlist YouTube vào ô URL
+2. Nhấn nút "Phân tích" để lấy thông tin
+3. Chọn chế độ tải xuống phù hợp
+4. Nhấn nút "Tải xuống" để bắt đầu tải
+
+## Các chế độ tải xuống
+- **Chỉ audio (MP3)**: Tải audio chất lượng cao nhất và chuyển sang MP3
+- **Chỉ video (không audio)**: Tải video MP4 không có âm thanh
+- **Video + audio (MP4)**: Tải và ghép video+audio chất lượng cao nhất
+- **Chọn format cụ thể**: Tải format cụ thể theo format ID
+
+## Tùy chọn nâng cao
+- **Tải thumbnail**: Tải hình thumbnail của video
+- **Tải subtitle**: Tải phụ đề của video (nếu có)
+- **Số luồng**: Số lượng video tải song song (đối với playlist)
+
+## Cài đặt
+Bạn có thể tùy chỉnh các cài đặt khác trong menu File > Cài đặt:
+- Thư mục lưu mặc định
+- Số luồng tải xuống
+- Giới hạn tốc độ
+- Proxy và cookies
+- Và nhiều tùy chọn khác
+
+## Yêu cầu hệ thống
+- Python 3.6 trở lên
+- FFmpeg (cần thiết để chuyển đổi định dạng)
+- yt-dlp
+
+## Lưu ý
+- Việc tải xuống nội dung có bản quyền có thể vi phạm điều khoản dịch vụ của YouTube
+- Chỉ sử dụng cho mục đích cá nhân và tuân thủ luật bản quyền
+"""
+
+# Worker-count hint shown next to both thread spinboxes.
+_WORKERS_HINT = f"khuyến nghị: {min(7, MAX_WORKERS_LIMIT)}, tối đa: {MAX_WORKERS_LIMIT}"
+
+# Font specs shared by every widget and style that uses them.
+_FONT_NORMAL_9 = ("Segoe UI", 9)
+_FONT_NORMAL_10 = ("Segoe UI", 10)
+_FONT_BOLD_10 = ("Segoe UI", 10, "bold")
+_FONT_HEADER_14 = ("Segoe UI", 14, "bold")
+_FONT_HEADER_16 = ("Segoe UI", 16, "bold")
+_FONT_MONO_9 = ("Consolas", 9)
+_FONT_TITLE_16 = ("Helvetica", 16, "bold")
+
+WIDGET_STYLES = {
+    "Modern.TNotebook": {"background": ColorTheme.BACKGROUND, "borderwidth": 0},
+    "Modern.TNotebook.Tab": {"padding": [20, 10], "font": _FONT_NORMAL_10},
+    "Modern.TEntry": {"fieldbackground": "white", "borderwidth": 1, "relief": "solid"},
+    "Modern.TCheckbutton": {
+        "background": ColorTheme.FRAME_BACKGROUND,
+        "font": _FONT_NORMAL_10,
+    },
+}
+
+# Shared look of the coloured buttons; "<Colour>.Action.TButton" inherits it.
+ACTION_BUTTON_STYLE = {
+    "font": _FONT_BOLD_10,
+    "padding": [15, 8],
+    "borderwidth": 0,
+    "relief": "flat",
+}
+
+# style name -> (background, foreground, active background, pressed background)
+BUTTON_STYLES = {
+    "Success.Action.TButton": ("#28a745", "#538C51", "#218838", "#1e7e34"),
+    "Warning.Action.TButton": ("#fd7e14", "#F2D399", "#e8690b", "#d35400"),
+    "Danger.Action.TButton": ("#dc3545", "#F24444", "#c82333", "#bd2130"),
+    "Primary.Action.TButton": (ColorTheme.PRIMARY_BLUE, "#B16E4B", "#0056b3", "#004085"),
+}
+
+_BUTTON_FOREGROUND_MAP = [
+    ("active", "#B9B7B3"),
+    ("pressed", "#B9B7B3"),
+    ("disabled", "#707070"),
+]
+
+# status -> (row values, status bar text) for a progress payload.
+STATUS_ROWS: Dict[str, Callable[[Dict[str, str]], Tuple[Tuple[str, ...], str]]] = {
+    "downloading": lambda p: (
+        (p["filename"], "Đang tải", f"{p['percent']}%", p["speed"], p["eta"]),
+        f"Đang tải: {p['percent']}% | {p['speed']} | ETA: {p['eta']}",
+    ),
+    "finished": lambda p: (
+        (p["filename"], "Hoàn thành", "100%", "", ""),
+        f"Đã tải xong: {p['filename']}",
+    ),
+    "error": lambda p: (
+        (p["filename"], "Lỗi", "", "", p["error"]),
+        f"Lỗi: {p['error']}",
+    ),
+}
+
+# Row colours come from Treeview tags, configured once per table.
+STATUS_COLOURS = {"finished": "#28a745", "error": "#dc3545"}
+
+DOWNLOAD_COLUMNS = (
+    ("filename", "📄 Tên file"),
+    ("status", "🚥 Trạng thái"),
+    ("progress", "📈 Tiến trình"),
+    ("speed", "⚡ Tốc độ"),
+    ("eta", "⏳ Thời gian còn lại"),
+)
+
+
+def _ensure_gui() -> None:
+    """Import the tkinter modules used by the GUI into this module."""
+    global tk, ttk, scrolledtext, filedialog, messagebox
+    if tk is not None:
+        return
+
+    import tkinter as _tk
+    from tkinter import filedialog as _filedialog
+    from tkinter import messagebox as _messagebox
+    from tkinter import scrolledtext as _scrolledtext
+    from tkinter import ttk as _ttk
+
+    tk = _tk
+    ttk = _ttk
+    scrolledtext = _scrolledtext
+    filedialog = _filedialog
+    messagebox = _messagebox
+
+
+@contextmanager
+def _editable(widget: Any) -> Iterator[None]:
+    """Temporarily enable a read-only text widget for one batch of edits."""
+    widget.config(state=tk.NORMAL)
+    try:
+        yield
+    finally:
+        widget.config(state=tk.DISABLED)
+
+
+def _new_dialog(master: Any) -> Any:
+    """Create a toplevel that stays hidden while its widgets are laid out."""
+    window = tk.Toplevel(master)
+    window.withdraw()
+    return window
+
+
+def _reopen_dialog(window: Optional[Any]) -> bool:
+    """Show a cached dialog again; False when it has to be built first."""
+    if window is None or not window.winfo_exists():
+        return False
+    window.deiconify()
+    window.lift()
+    return True
+
+
+def _show_dialog(window: Any) -> None:
+    """Settle the layout of a dialog from ``_new_dialog`` in one pass and show it."""
+    window.update_idletasks()
+    window.deiconify()
+
 
 class GraphicalUserInterface:
     """Tk GUI for YouTube Downloader Pro."""
 
-    def __init__(self) -> None:
+    # Theme each Tk root was last styled for; styles live in the interpreter.
+    _styled_roots: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, config_manager: Optional[ConfigManager] = None) -> None:
         if not GUI_AVAILABLE:
             raise ImportError("Không thể tạo giao diện đồ họa. Vui lòng cài đặt tkinter.")
+        _ensure_gui()
 
-        self.config_manager = ConfigManager()
+        self.config_manager = config_manager or ConfigManager()
         self.downloader = YouTubeDownloader(self.config_manager)
         self.downloader.add_progress_callback(self.update_progress)
+        # Latest payload per file, drained on the Tk thread by _flush_updates.
+        self._pending_updates: Dict[str, Dict[str, str]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        # Help and about windows are built on first open, then only hidden.
+        self._help_window: Optional[Any] = None
+        self._about_window: Optional[Any] = None
+        # URLs analysed this session; analysing one again bypasses the
+        # metadata cache so the user sees fresh data.
+        self._analyzed_urls: Set[str] = set()
 
         self.root = tk.Tk()
         self.root.title(f"🎬 YouTube Downloader Pro {VERSION}")
@@ -51,6 +248,9 @@ class GraphicalUserInterface:
         self.root.configure(bg=ColorTheme.BACKGROUND)
 
         self.style = ModernStyle.configure_ttk_style()
+        # Styled widget factories for the dialogs built after start-up.
+        self._modern_entry = partial(ttk.Entry, style="Modern.TEntry")
+        self._modern_checkbutton = partial(ttk.Checkbutton, style="Modern.TCheckbutton")
 
         try:
             # self.root.iconbitmap("icon.ico")
@@ -60,125 +260,35 @@ class GraphicalUserInterface:
 
         self.setup_ui()
         self.setup_styles()
+        self._create_settings_vars()
 
-        self.root.after(1000, self.check_for_updates)
+        if self.config_manager.general.check_for_updates:
+            self.root.after(1000, self.check_for_updates)
 
     def setup_styles(self) -> None:
         style = ttk.Style()
+        theme = style.theme_use()
+        if self._styled_roots.get(self.root) == theme:
+            return
 
-        style.configure(
-            "Modern.TNotebook",
-            background=ColorTheme.BACKGROUND,
-            borderwidth=0,
-        )
-        style.configure(
-            "Modern.TNotebook.Tab",
-            padding=[20, 10],
-            font=("Segoe UI", 10),
-        )
-        style.configure(
-            "Modern.TEntry",
-            fieldbackground="white",
-            borderwidth=1,
-            relief="solid",
-        )
-        style.configure(
-            "Modern.TCheckbutton",
-            background=ColorTheme.FRAME_BACKGROUND,
-            font=("Segoe UI", 10),
-        )
-
-        style.configure(
-            "Success.TButton",
-            background="#28a745",
-            foreground="#538C51",
-            font=("Segoe UI", 10, "bold"),
-            padding=[15, 8],
-            borderwidth=0,
-            relief="flat",
-        )
-        style.map(
-            "Success.TButton",
-            background=[
-                ("active", "#218838"),
-                ("pressed", "#1e7e34"),
-                ("disabled", "#6c757d"),
-            ],
-            foreground=[
-                ("active", "#B9B7B3"),
-                ("pressed", "#B9B7B3"),
-                ("disabled", "#707070"),
-            ],
-        )
-
-        style.configure(
-            "Warning.TButton",
-            background="#fd7e14",
-            foreground="#F2D399",
-            font=("Segoe UI", 10, "bold"),
-            padding=[15, 8],
-            borderwidth=0,
-            relief="flat",
-        )
-        style.map(
-            "Warning.TButton",
-            background=[
-                ("active", "#e8690b"),
-                ("pressed", "#d35400"),
-                ("disabled", "#6c757d"),
-            ],
-            foreground=[
-                ("active", "#B9B7B3"),
-                ("pressed", "#B9B7B3"),
-                ("disabled", "#707070"),
-            ],
-        )
-
-        style.configure(
-            "Danger.TButton",
-            background="#dc3545",
-            foreground="#F24444",
-            font=("Segoe UI", 10, "bold"),
-            padding=[15, 8],
-            borderwidth=0,
-            relief="flat",
-        )
-        style.map(
-            "Danger.TButton",
-            background=[
-                ("active", "#c82333"),
-                ("pressed", "#bd2130"),
-                ("disabled", "#6c757d"),
-            ],
-            foreground=[
-                ("active", "#B9B7B3"),
-                ("pressed", "#B9B7B3"),
-                ("disabled", "#707070"),
-            ],
-        )
+        for name, options in WIDGET_STYLES.items():
+            style.configure(name, **options)
+
+        style.configure("Action.TButton", **ACTION_BUTTON_STYLE)
+        style.map("Action.TButton", foreground=_BUTTON_FOREGROUND_MAP)
+
+        for name, (background, foreground, active, pressed) in BUTTON_STYLES.items():
+            style.configure(name, background=background, foreground=foreground)
+            style.map(
+                name,
+                background=[
+                    ("active", active),
+                    ("pressed", pressed),
+                    ("disabled", "#6c757d"),
+                ],
+            )
 
-        style.configure(
-            "Primary.TButton",
-            background=ColorTheme.PRIMARY_BLUE,
-            foreground="#B16E4B",
-            font=("Segoe UI", 10, "bold"),
-            padding=[15, 8],
-            borderwidth=0,
-            relief="flat",
-        )
-        style.map(
-            "Primary.TButton",
-            background=[
-                ("active", "#0056b3"),
-                ("pressed", "#004085"),
-                ("disabled", "#6c757d"),
-            ],
-            foreground=[
-                ("active", "#B9B7B3"),
-                ("pressed", "#B9B7B3"),
-                ("disabled", "#707070"),
-            ],
-        )
+        self._styled_roots[self.root] = theme
 
     def create_menu(self) -> None:
         menubar = tk.Menu(self.root)
@@ -205,10 +315,19 @@ class GraphicalUserInterface:
         self.root.config(menu=menubar)
 
     def setup_ui(self) -> None:
-        self.create_menu()
+        # The menu and the progress table are not needed for the first
+        # paint: the menu is built once the window is idle and the table
+        # when the first download starts.
+        self.root.after_idle(self.create_menu)
+        self.downloads_tree = None
+        # Row ids keyed by filename, so progress updates skip scanning the tree,
+        # and the values last written to each row, so repeats skip Tcl.
+        self._row_by_filename: Dict[str, str] = {}
+        self._last_values: Dict[str, Tuple[str, ...]] = {}
 
         main_container = tk.Frame(self.root, bg=ColorTheme.BACKGROUND)
         main_container.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        self.main_container = main_container
 
         header_frame = ttk.Frame(main_container, style="Card.TFrame")
         header_frame.pack(fill=tk.X, pady=(0, 15))
@@ -219,7 +338,7 @@ class GraphicalUserInterface:
         tk.Label(
             title_frame,
             text="🎬 YouTube Downloader Pro",
-            font=("Segoe UI", 16, "bold"),
+            font=_FONT_HEADER_16,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.CARD_BACKGROUND,
         ).pack(side=tk.LEFT)
@@ -227,7 +346,7 @@ class GraphicalUserInterface:
         tk.Label(
             title_frame,
             text=f"v{VERSION}",
-            font=("Segoe UI", 10),
+            font=_FONT_NORMAL_10,
             fg=ColorTheme.TEXT_SECONDARY,
             bg=ColorTheme.CARD_BACKGROUND,
         ).pack(side=tk.RIGHT)
@@ -246,13 +365,13 @@ class GraphicalUserInterface:
         tk.Label(
             url_input_frame,
             text="URL:",
-            font=("Segoe UI", 10, "bold"),
+            font=_FONT_BOLD_10,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).pack(side=tk.LEFT, padx=(0, 10))
 
         self.url_entry = ttk.Entry(
-            url_input_frame, style="Modern.TEntry", font=("Segoe UI", 10)
+            url_input_frame, style="Modern.TEntry", font=_FONT_NORMAL_10
         )
         self.url_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
 
@@ -260,7 +379,7 @@ class GraphicalUserInterface:
             url_input_frame,
             text="🔍 Phân tích",
             command=self.analyze_url,
-            style="Primary.TButton",
+            style="Primary.Action.TButton",
         )
         self.analyze_button.pack(side=tk.LEFT)
 
@@ -279,7 +398,7 @@ class GraphicalUserInterface:
             text_frame,
             wrap=tk.WORD,
             height=8,
-            font=("Consolas", 9),
+            font=_FONT_MONO_9,
             bg="white",
             fg=ColorTheme.TEXT_PRIMARY,
             selectbackground=ColorTheme.SECONDARY_BLUE,
@@ -304,35 +423,28 @@ class GraphicalUserInterface:
         tk.Label(
             self.options_frame,
             text="🎯 Chế độ tải:",
-            font=("Segoe UI", 10, "bold"),
+            font=_FONT_BOLD_10,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=0, column=0, sticky=tk.W, pady=5)
 
         self.download_mode = tk.StringVar(value="3")
-        modes = [
-            ("🎵 Audio (MP3)", "1"),
-            ("🎥 Video (không audio)", "2"),
-            ("🎞️ Video + Audio (MP4)", "3"),
-            ("🧩 Format cụ thể", "4"),
-        ]
 
         mode_frame = tk.Frame(self.options_frame, bg=ColorTheme.FRAME_BACKGROUND)
         mode_frame.grid(row=0, column=1, sticky=tk.W, pady=5)
 
-        for idx, (text, value) in enumerate(modes):
-            ttk.Radiobutton(
-                mode_frame,
-                text=text,
-                value=value,
-                variable=self.download_mode,
-                style="Modern.TRadiobutton",
-            ).grid(row=0, column=idx, padx=(0, 15), sticky=tk.W)
+        common = {"variable": self.download_mode, "style": "Modern.TRadiobutton"}
+        mode_buttons = [
+            ttk.Radiobutton(mode_frame, text=text, value=value, **common)
+            for text, value in DOWNLOAD_MODES
+        ]
+        for idx, button in enumerate(mode_buttons):
+            button.grid(row=0, column=idx, padx=(0, 15), sticky=tk.W)
 
         tk.Label(
             self.options_frame,
             text="🧾 Format ID:",
-            font=("Segoe UI", 10),
+            font=_FONT_NORMAL_10,
             fg=ColorTheme.TEXT_SECONDARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=1, column=0, sticky=tk.W, pady=5)
@@ -342,7 +454,7 @@ class GraphicalUserInterface:
         tk.Label(
             self.options_frame,
             text="📁 Thư mục lưu:",
-            font=("Segoe UI", 10, "bold"),
+            font=_FONT_BOLD_10,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=2, column=0, sticky=tk.W, pady=5, padx=(0, 8))
@@ -357,14 +469,12 @@ class GraphicalUserInterface:
             self.options_frame,
             text="📂 Duyệt...",
             command=self.browse_directory,
-            style="Warning.TButton",
+            style="Warning.Action.TButton",
         )
         self.browse_button.grid(row=2, column=2, sticky="e", padx=(8, 0), pady=5)
 
         advanced_frame = tk.Frame(self.options_frame, bg=ColorTheme.FRAME_BACKGROUND)
         advanced_frame.grid(row=3, column=0, columnspan=3, sticky="ew", pady=(10, 0))
-        for idx in range(6):
-            advanced_frame.columnconfigure(idx, weight=0)
         advanced_frame.columnconfigure(6, weight=1)
 
         self.download_thumbnail = tk.BooleanVar(value=False)
@@ -385,20 +495,22 @@ class GraphicalUserInterface:
 
         tk.Label(
             advanced_frame,
-            text="⚡ Số luồng (khuyến nghị: 7, tối đa: 10):",
-            font=("Segoe UI", 9),
+            text=f"⚡ Số luồng ({_WORKERS_HINT}):",
+            font=_FONT_NORMAL_9,
             fg=ColorTheme.TEXT_SECONDARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=0, column=2, padx=(0, 5), sticky="w")
 
-        self.max_workers = tk.StringVar(value="1")
+        self.max_workers = tk.StringVar(
+            value=str(self.config_manager.get_download_options().max_workers)
+        )
         ttk.Spinbox(
             advanced_frame,
             from_=1,
-            to=10,
+            to=MAX_WORKERS_LIMIT,
             width=5,
             textvariable=self.max_workers,
-            font=("Segoe UI", 9),
+            font=_FONT_NORMAL_9,
         ).grid(row=0, column=3, sticky="w")
 
         tk.Label(advanced_frame, bg=ColorTheme.FRAME_BACKGROUND).grid(
@@ -409,7 +521,7 @@ class GraphicalUserInterface:
             advanced_frame,
             text="⬇️ Tải xuống",
             command=self.start_download,
-            style="Success.TButton",
+            style="Success.Action.TButton",
         )
         self.download_button.grid(row=0, column=7, sticky="e", padx=(0, 8))
 
@@ -417,41 +529,70 @@ class GraphicalUserInterface:
             advanced_frame,
             text="🛑 Hủy",
             command=self.cancel_download,
-            style="Danger.TButton",
+            style="Danger.Action.TButton",
             state=tk.DISABLED,
         )
         self.cancel_button.grid(row=0, column=8, sticky="e")
+        self._downloading = False
+        self._watch_option_vars()
+
+        self.status_var = tk.StringVar(value="⏺️ Sẵn sàng")
+        status_bar = tk.Label(
+            self.root,
+            textvariable=self.status_var,
+            relief=tk.SUNKEN,
+            anchor=tk.W,
+            bg=ColorTheme.PRIMARY_BLUE,
+            fg="white",
+            font=_FONT_NORMAL_9,
+            height=1,
+        )
+        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+
+    def _watch_option_vars(self) -> None:
+        """Mirror the download option variables so reads skip Tcl."""
+        watched = {
+            "mode": self.download_mode,
+            "thumbnail": self.download_thumbnail,
+            "subtitle": self.download_subtitle,
+            "max_workers": self.max_workers,
+        }
+        self._option_values: Dict[str, Any] = {}
+        for key, var in watched.items():
+            self._remember_option(key, var)
+            var.trace_add("write", partial(self._remember_option, key, var))
 
+    def _remember_option(self, key: str, var: Any, *_trace_args: Any) -> None:
+        try:
+            self._option_values[key] = var.get()
+        except tk.TclError:
+            self._option_values[key] = None
+
+    def _build_progress_frame(self) -> None:
         self.progress_frame = ttk.LabelFrame(
-            main_container,
+            self.main_container,
             text="📊 Tiến trình tải xuống",
             style="Modern.TLabelframe",
             padding=5,
         )
         self.progress_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        columns = ("filename", "status", "progress", "speed", "eta")
         self.downloads_tree = ttk.Treeview(
             self.progress_frame,
-            columns=columns,
+            columns=tuple(col for col, _ in DOWNLOAD_COLUMNS),
             show="headings",
             style="Modern.Treeview",
             height=10,
         )
-
-        headers = {
-            "filename": "📄 Tên file",
-            "status": "🚥 Trạng thái",
-            "progress": "📈 Tiến trình",
-            "speed": "⚡ Tốc độ",
-            "eta": "⏳ Thời gian còn lại",
-        }
-        for col, header in headers.items():
+        for col, header in DOWNLOAD_COLUMNS:
             self.downloads_tree.heading(col, text=header, anchor="center")
             self.downloads_tree.column(
                 col, width=120, minwidth=80, stretch=True, anchor="center"
             )
 
+        for status, colour in STATUS_COLOURS.items():
+            self.downloads_tree.tag_configure(status, foreground=colour)
+
         self.downloads_tree.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
 
         scrollbar = ttk.Scrollbar(
@@ -460,168 +601,159 @@ class GraphicalUserInterface:
         self.downloads_tree.configure(yscroll=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.status_var = tk.StringVar(value="⏺️ Sẵn sàng")
-        status_bar = tk.Label(
-            self.root,
-            textvariable=self.status_var,
-            relief=tk.SUNKEN,
-            anchor=tk.W,
-            bg=ColorTheme.PRIMARY_BLUE,
-            fg="white",
-            font=("Segoe UI", 9),
-            height=1,
-        )
-        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
-
     def update_progress(self, task: DownloadTask) -> None:
+        filename = task.progress.filename
+        if not filename:
+            return
+
         payload = {
-            "filename": task.progress.filename,
+            "filename": filename,
             "status": task.progress.status,
             "percent": f"{task.progress.percent:.1f}",
             "speed": task.progress.speed,
             "eta": task.progress.eta,
             "error": task.progress.error_message,
         }
-        self.root.after(0, self._update_progress_ui, payload)
+        with self._pending_lock:
+            self._pending_updates[filename] = payload
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.root.after(PROGRESS_REFRESH_MS, self._flush_updates)
+
+    def _flush_updates(self) -> None:
+        with self._pending_lock:
+            pending, self._pending_updates = self._pending_updates, {}
+            self._flush_scheduled = False
+        for payload in pending.values():
+            self._update_progress_ui(payload)
 
     def _update_progress_ui(self, payload: Dict[str, str]) -> None:
         filename = payload["filename"]
-        if not filename:
-            return
-
-        item_id: Optional[str] = None
-        for item in self.downloads_tree.get_children():
-            values = self.downloads_tree.item(item, "values")
-            if values and values[0] == filename:
-                item_id = item
-                break
+        if self.downloads_tree is None:
+            self._build_progress_frame()
 
+        item_id = self._row_by_filename.get(filename)
         if item_id is None:
             item_id = self.downloads_tree.insert(
                 "", "end", values=(filename, "Đang tải", "0%", "N/A", "N/A")
             )
+            self._row_by_filename[filename] = item_id
 
         status = payload["status"]
-        if status == "downloading":
-            self.downloads_tree.item(
-                item_id,
-                values=(
-                    filename,
-                    "Đang tải",
-                    f"{payload['percent']}%",
-                    payload["speed"],
-                    payload["eta"],
-                ),
-            )
-            self.status_var.set(
-                f"Đang tải: {payload['percent']}% | {payload['speed']} | ETA: {payload['eta']}"
-            )
-        elif status == "finished":
-            self.downloads_tree.item(
-                item_id, values=(filename, "Hoàn thành", "100%", "", "")
-            )
-            self.status_var.set(f"Đã tải xong: {filename}")
-        elif status == "error":
-            self.downloads_tree.item(
-                item_id,
-                values=(filename, "Lỗi", "", "", payload["error"]),
-            )
-            self.status_var.set(f"Lỗi: {payload['error']}")
+        render = STATUS_ROWS.get(status)
+        if render is None:
+            return
+        values, status_text = render(payload)
 
-    def analyze_url(self) -> None:
+        if self._last_values.get(item_id) != values:
+            self.downloads_tree.item(item_id, values=values, tags=(status,))
+            self._last_values[item_id] = values
+        self.status_var.set(status_text)
+
+    def _read_url(self) -> Optional[str]:
+        """Return the entered URL, or warn and return None if it is unusable."""
         url = self.url_entry.get().strip()
         if not url:
             messagebox.showwarning("Cảnh báo", "Vui lòng nhập URL YouTube.")
+            return None
+        if not YOUTUBE_URL_RE.match(url):
+            messagebox.showwarning(
+                "Cảnh báo", "URL không hợp lệ. Vui lòng nhập URL YouTube."
+            )
+            return None
+        return url
+
+    def analyze_url(self) -> None:
+        url = self._read_url()
+        if url is None:
             return
 
         self.status_var.set("Đang phân tích URL...")
-        self.info_text.config(state=tk.NORMAL)
-        self.info_text.delete(1.0, tk.END)
-        self.info_text.insert(tk.END, "Đang phân tích URL, vui lòng đợi...")
-        self.info_text.config(state=tk.DISABLED)
-        self.root.update()
+        self._set_info_text("Đang phân tích URL, vui lòng đợi...")
+        self.analyze_button.config(state=tk.DISABLED)
 
-        try:
-            is_playlist = self.downloader.is_playlist(url)
-
-            if is_playlist:
-                playlist_info = self.downloader.get_playlist_info(url)
-
-                self.info_text.config(state=tk.NORMAL)
-                self.info_text.delete(1.0, tk.END)
-                self.info_text.insert(tk.END, "=== THÔNG TIN PLAYLIST ===\n")
-                self.info_text.insert(tk.END, f"Tiêu đề: {playlist_info.title}\n")
-                self.info_text.insert(tk.END, f"Kênh: {playlist_info.uploader}\n")
-                self.info_text.insert(
-                    tk.END, f"Số lượng video: {playlist_info.video_count}\n\n"
-                )
+        if url in self._analyzed_urls:
+            self.downloader.refresh_metadata(url)
+        self._analyzed_urls.add(url)
 
-                if playlist_info.video_count > 10:
-                    self.info_text.insert(
-                        tk.END,
-                        f"⚠️ Playlist này có {playlist_info.video_count} video. Tải xuống có thể mất nhiều thời gian.\n\n",
-                    )
+        threading.Thread(target=self._analyze_thread, args=(url,), daemon=True).start()
 
-                self.info_text.config(state=tk.DISABLED)
-                self.status_var.set(f"Đã phân tích playlist: {playlist_info.title}")
+    def _analyze_thread(self, url: str) -> None:
+        try:
+            if self.downloader.is_playlist(url):
+                info: Union[PlaylistInfo, VideoInfo] = self.downloader.get_playlist_info(url)
             else:
-                video_info = self.downloader.get_video_info(url)
-
-                self.info_text.config(state=tk.NORMAL)
-                self.info_text.delete(1.0, tk.END)
-                self.info_text.insert(tk.END, "=== THÔNG TIN VIDEO ===\n")
-                self.info_text.insert(tk.END, f"Tiêu đề: {video_info.title}\n")
-                self.info_text.insert(tk.END, f"Kênh: {video_info.uploader}\n")
-                self.info_text.insert(
-                    tk.END, f"Thời lượng: {format_duration(video_info.duration)}\n"
-                )
-                if video_info.view_count:
-                    self.info_text.insert(
-                        tk.END, f"Lượt xem: {video_info.view_count:,}\n".replace(",", ".")
-                    )
-                self.info_text.insert(tk.END, f"Ngày đăng: {video_info.upload_date}\n\n")
-
-                self.info_text.insert(tk.END, "=== ĐỊNH DẠNG CÓ SẴN ===\n")
-
-                video_formats = [f for f in video_info.formats if f.has_video]
-                video_formats.sort(
-                    key=lambda f: int(f.resolution.replace("p", ""))
-                    if f.resolution.replace("p", "").isdigit()
-                    else 0,
-                    reverse=True,
+                info = self.downloader.get_video_info(url)
+        except Exception as exc:
+            logger.exception("Lỗi khi phân tích URL: %s", exc)
+            self.root.after(0, self._analysis_failed, str(exc))
+            return
+        self.root.after(0, self._show_analysis, info)
+
+    def _analysis_done(self) -> None:
+        if not self._downloading:
+            self.analyze_button.config(state=tk.NORMAL)
+
+    def _analysis_failed(self, error_message: str) -> None:
+        self._analysis_done()
+        self._set_info_text(f"Lỗi khi phân tích URL:\n{error_message}")
+        self.status_var.set("Lỗi khi phân tích URL")
+
+    def _show_analysis(self, info: Union[PlaylistInfo, VideoInfo]) -> None:
+        self._analysis_done()
+
+        if isinstance(info, PlaylistInfo):
+            lines = [
+                "=== THÔNG TIN PLAYLIST ===",
+                f"Tiêu đề: {info.title}",
+                f"Kênh: {info.uploader}",
+                f"Số lượng video: {info.video_count}",
+                "",
+            ]
+            if info.video_count > 10:
+                lines.append(
+                    f"⚠️ Playlist này có {info.video_count} video. Tải xuống có thể mất nhiều thời gian."
                 )
+                lines.append("")
 
-                self.info_text.insert(tk.END, "Video:\n")
-                for fmt in video_formats[:5]:
-                    self.info_text.insert(tk.END, f" • {fmt}\n")
-                if len(video_formats) > 5:
-                    self.info_text.insert(
-                        tk.END, f" • ... và {len(video_formats) - 5} định dạng khác\n"
-                    )
-
-                audio_formats = [
-                    f for f in video_info.formats if not f.has_video and f.has_audio
-                ]
-                audio_formats.sort(key=lambda f: f.bitrate, reverse=True)
-
-                self.info_text.insert(tk.END, "\nAudio:\n")
-                for fmt in audio_formats[:3]:
-                    self.info_text.insert(tk.END, f" • {fmt}\n")
-                if len(audio_formats) > 3:
-                    self.info_text.insert(
-                        tk.END, f" • ... và {len(audio_formats) - 3} định dạng khác\n"
-                    )
-
-                self.info_text.config(state=tk.DISABLED)
-                self.status_var.set(f"Đã phân tích video: {video_info.title}")
-        except Exception as exc:
-            self.info_text.config(state=tk.NORMAL)
-            self.info_text.delete(1.0, tk.END)
-            self.info_text.insert(tk.END, f"Lỗi khi phân tích URL:\n{exc}")
-            self.info_text.config(state=tk.DISABLED)
-            self.status_var.set("Lỗi khi phân tích URL")
-            logger.error("Lỗi khi phân tích URL: %s", exc)
-            traceback.print_exc()
+            self._set_info_text("\n".join(lines) + "\n")
+            self.status_var.set(f"Đã phân tích playlist: {info.title}")
+            return
+
+        lines = [
+            "=== THÔNG TIN VIDEO ===",
+            f"Tiêu đề: {info.title}",
+            f"Kênh: {info.uploader}",
+            f"Thời lượng: {format_duration(info.duration)}",
+        ]
+        if info.view_count:
+            lines.append(f"Lượt xem: {format_count(info.view_count)}")
+        lines.append(f"Ngày đăng: {info.upload_date}")
+        lines.append("")
+        lines.append("=== ĐỊNH DẠNG CÓ SẴN ===")
+
+        video_formats = info.video_formats_sorted
+        lines.append("Video:")
+        lines.extend(f" • {fmt}" for fmt in video_formats[:5])
+        if len(video_formats) > 5:
+            lines.append(f" • ... và {len(video_formats) - 5} định dạng khác")
+
+        audio_formats = info.audio_formats_sorted
+        lines.append("")
+        lines.append("Audio:")
+        lines.extend(f" • {fmt}" for fmt in audio_formats[:3])
+        if len(audio_formats) > 3:
+            lines.append(f" • ... và {len(audio_formats) - 3} định dạng khác")
+
+        self._set_info_text("\n".join(lines) + "\n")
+        self.status_var.set(f"Đã phân tích video: {info.title}")
+
+    def _set_info_text(self, text: str) -> None:
+        """Replace the info panel contents with a single insert."""
+        with _editable(self.info_text):
+            self.info_text.delete("1.0", tk.END)
+            self.info_text.insert("1.0", text)
 
     def browse_directory(self) -> None:
         directory = filedialog.askdirectory(initialdir=self.save_dir_entry.get())
@@ -632,19 +764,22 @@ class GraphicalUserInterface:
     def get_download_options(self) -> DownloadOptions:
         options = self.config_manager.get_download_options()
 
+        values = self._option_values
         options.download_dir = self.save_dir_entry.get() or DEFAULT_DOWNLOAD_DIR
         try:
-            max_workers_value = int(self.max_workers.get())
-        except ValueError:
+            max_workers_value = int(values["max_workers"])
+        except (TypeError, ValueError):
             max_workers_value = options.max_workers or 1
             messagebox.showwarning(
                 "Cảnh báo", "Số luồng không hợp lệ. Đã sử dụng giá trị gần nhất."
             )
 
-        if max_workers_value > 10:
-            max_workers_value = 10
+        if max_workers_value > MAX_WORKERS_LIMIT:
+            max_workers_value = MAX_WORKERS_LIMIT
             messagebox.showwarning(
-                "Cảnh báo", "Số luồng tối đa là 10. Đã điều chỉnh về 10."
+                "Cảnh báo",
+                f"Số luồng tối đa là {MAX_WORKERS_LIMIT}. "
+                f"Đã điều chỉnh về {MAX_WORKERS_LIMIT}.",
             )
         elif max_workers_value < 1:
             max_workers_value = 1
@@ -653,13 +788,13 @@ class GraphicalUserInterface:
             )
 
         options.max_workers = max_workers_value
-        options.download_thumbnails = self.download_thumbnail.get()
-        options.download_subtitles = self.download_subtitle.get()
+        options.download_thumbnails = bool(values["thumbnail"])
+        options.download_subtitles = bool(values["subtitle"])
         options.output_template = os.path.join(
             options.download_dir, "%(title)s.%(ext)s"
         )
 
-        mode = self.download_mode.get()
+        mode = values["mode"]
         if mode == "1":
             options.format_selector = "bestaudio"
             options.convert_to_mp3 = True
@@ -686,15 +821,14 @@ class GraphicalUserInterface:
         return options
 
     def start_download(self) -> None:
-        url = self.url_entry.get().strip()
-        if not url:
-            messagebox.showwarning("Cảnh báo", "Vui lòng nhập URL YouTube.")
+        url = self._read_url()
+        if url is None:
             return
 
         options = self.get_download_options()
 
         try:
-            os.makedirs(options.download_dir, exist_ok=True)
+            self.downloader.ensure_dir(options.download_dir)
         except Exception as exc:
             messagebox.showerror(
                 "Lỗi",
@@ -702,49 +836,57 @@ class GraphicalUserInterface:
             )
             return
 
-        self.download_button.config(state=tk.DISABLED)
-        self.analyze_button.config(state=tk.DISABLED)
-        self.cancel_button.config(state=tk.NORMAL)
-
-        for item in self.downloads_tree.get_children():
-            self.downloads_tree.delete(item)
-
-        self.status_var.set("Đang bắt đầu tải xuống...")
+        self._clear_downloads_tree()
+        self._set_ui_state(True, "Đang bắt đầu tải xuống...")
 
         self.download_thread = threading.Thread(
             target=self._download_thread, args=(url, options), daemon=True
         )
         self.download_thread.start()
 
+    def _set_ui_state(self, downloading: bool, status: str) -> None:
+        """Toggle the action buttons for a download starting or ending."""
+        if downloading != self._downloading:
+            busy, idle = (tk.DISABLED, tk.NORMAL) if downloading else (tk.NORMAL, tk.DISABLED)
+            self.download_button.config(state=busy)
+            self.analyze_button.config(state=busy)
+            self.cancel_button.config(state=idle)
+            self._downloading = downloading
+        if not downloading:
+            # The batch is over; the rows stay but their memo is not needed.
+            self._last_values.clear()
+        self.status_var.set(status)
+
+    def _clear_downloads_tree(self) -> None:
+        if self.downloads_tree is None:
+            self._build_progress_frame()
+        else:
+            self.downloads_tree.delete(*self.downloads_tree.get_children())
+        self._row_by_filename.clear()
+        self._last_values.clear()
+
     def _download_thread(self, url: str, options: DownloadOptions) -> None:
         try:
             success = self.downloader.download(url, options)
             self.root.after(0, self._download_completed, success)
         except Exception as exc:
-            logger.error("Lỗi khi tải xuống: %s", exc)
-            traceback.print_exc()
+            logger.exception("Lỗi khi tải xuống: %s", exc)
             self.root.after(0, self._download_error, str(exc))
 
     def _download_completed(self, success: bool) -> None:
-        self.download_button.config(state=tk.NORMAL)
-        self.analyze_button.config(state=tk.NORMAL)
-        self.cancel_button.config(state=tk.DISABLED)
-
         if success:
-            self.status_var.set("Tải xuống hoàn tất!")
+            self._set_ui_state(False, "Tải xuống hoàn tất!")
             messagebox.showinfo("Thông báo", "Tải xuống hoàn tất!")
         else:
-            self.status_var.set("Tải xuống không thành công. Xem log để biết chi tiết.")
+            self._set_ui_state(
+                False, "Tải xuống không thành công. Xem log để biết chi tiết."
+            )
             messagebox.showerror(
                 "Lỗi", "Tải xuống không thành công. Xem log để biết chi tiết."
             )
 
     def _download_error(self, error_message: str) -> None:
-        self.download_button.config(state=tk.NORMAL)
-        self.analyze_button.config(state=tk.NORMAL)
-        self.cancel_button.config(state=tk.DISABLED)
-
-        self.status_var.set(f"Lỗi: {error_message}")
+        self._set_ui_state(False, f"Lỗi: {error_message}")
         messagebox.showerror("Lỗi", f"Lỗi khi tải xuống: {error_message}")
 
     def cancel_download(self) -> None:
@@ -752,10 +894,7 @@ class GraphicalUserInterface:
             "Xác nhận", "Bạn có chắc muốn hủy tất cả các tải xuống đang chạy?"
         ):
             self.downloader.cancel_all_downloads()
-            self.status_var.set("Đã hủy tất cả các tải xuống.")
-            self.download_button.config(state=tk.NORMAL)
-            self.analyze_button.config(state=tk.NORMAL)
-            self.cancel_button.config(state=tk.DISABLED)
+            self._set_ui_state(False, "Đã hủy tất cả các tải xuống.")
 
     def check_for_updates(self) -> None:
         try:
@@ -792,13 +931,8 @@ class GraphicalUserInterface:
             "Tiếp tục tải xuống",
             f"Tìm thấy {len(tasks_data)} tải xuống bị gián đoạn. Bạn có muốn tiếp tục?",
         ):
-            for item in self.downloads_tree.get_children():
-                self.downloads_tree.delete(item)
-
-            self.download_button.config(state=tk.DISABLED)
-            self.analyze_button.config(state=tk.DISABLED)
-            self.cancel_button.config(state=tk.NORMAL)
-            self.status_var.set("Đang tiếp tục tải xuống...")
+            self._clear_downloads_tree()
+            self._set_ui_state(True, "Đang tiếp tục tải xuống...")
 
             self.download_thread = threading.Thread(
                 target=self._resume_thread, daemon=True
@@ -810,30 +944,35 @@ class GraphicalUserInterface:
             success = self.downloader.resume_downloads()
             self.root.after(0, self._download_completed, success)
         except Exception as exc:
-            logger.error("Lỗi khi tiếp tục tải xuống: %s", exc)
-            traceback.print_exc()
+            logger.exception("Lỗi khi tiếp tục tải xuống: %s", exc)
             self.root.after(0, self._download_error, str(exc))
 
     def clear_download_history(self) -> None:
-        if messagebox.askyesno(
+        # Nothing to clear: say so instead of asking for a pointless confirmation.
+        if not os.path.exists(STATE_FILE):
+            messagebox.showinfo("Thông báo", "Không có lịch sử tải xuống.")
+            return
+
+        if not messagebox.askyesno(
             "Xác nhận", "Bạn có chắc muốn xóa lịch sử tải xuống?"
         ):
-            try:
-                if os.path.exists(STATE_FILE):
-                    os.remove(STATE_FILE)
-                    messagebox.showinfo("Thông báo", "Đã xóa lịch sử tải xuống.")
-                else:
-                    messagebox.showinfo("Thông báo", "Không có lịch sử tải xuống.")
-            except Exception as exc:
-                messagebox.showerror("Lỗi", f"Không thể xóa lịch sử tải xuống: {exc}")
+            return
+
+        try:
+            os.remove(STATE_FILE)
+        except FileNotFoundError:
+            messagebox.showinfo("Thông báo", "Không có lịch sử tải xuống.")
+        except Exception as exc:
+            messagebox.showerror("Lỗi", f"Không thể xóa lịch sử tải xuống: {exc}")
+        else:
+            messagebox.showinfo("Thông báo", "Đã xóa lịch sử tải xuống.")
 
     def show_settings(self) -> None:
-        settings_window = tk.Toplevel(self.root)
+        settings_window = _new_dialog(self.root)
         settings_window.title("⚙️ Cài đặt")
         settings_window.geometry("700x500")
         settings_window.minsize(700, 500)
         settings_window.configure(bg=ColorTheme.BACKGROUND)
-        settings_window.grab_set()
 
         header = tk.Frame(settings_window, bg=ColorTheme.PRIMARY_BLUE, height=60)
         header.pack(fill=tk.X)
@@ -842,7 +981,7 @@ class GraphicalUserInterface:
         tk.Label(
             header,
             text="⚙️ Cài đặt ứng dụng",
-            font=("Segoe UI", 14, "bold"),
+            font=_FONT_HEADER_14,
             fg="white",
             bg=ColorTheme.PRIMARY_BLUE,
         ).pack(expand=True)
@@ -850,15 +989,96 @@ class GraphicalUserInterface:
         notebook = ttk.Notebook(settings_window, style="Modern.TNotebook")
         notebook.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
 
-        general_tab = tk.Frame(
-            notebook, bg=ColorTheme.FRAME_BACKGROUND, padx=20, pady=20
-        )
-        notebook.add(general_tab, text="🏠 Chung")
+        # save_settings reads every variable, so they are all reset up front;
+        # only the widgets of each tab wait until the tab is first shown.
+        self._load_settings_vars()
+
+        tab_options = {"bg": ColorTheme.FRAME_BACKGROUND, "padx": 20, "pady": 20}
+        self._settings_builders: Dict[str, Tuple[Any, Callable[[Any], None]]] = {}
+        for label, builder in (
+            ("🏠 Chung", self._build_general_tab),
+            ("⬇️ Tải xuống", self._build_download_tab),
+            ("🔐 Xác thực", self._build_auth_tab),
+        ):
+            tab = tk.Frame(notebook, **tab_options)
+            notebook.add(tab, text=label)
+            self._settings_builders[str(tab)] = (tab, builder)
+        self._settings_built: Set[str] = set()
+        # Fill the selected (first) tab before listening for tab changes.
+        self._build_settings_tab(notebook.select())
+        notebook.bind("<<NotebookTabChanged>>", self._on_settings_tab_changed)
+
+        button_frame = tk.Frame(settings_window, bg=ColorTheme.BACKGROUND)
+        button_frame.pack(fill=tk.X, padx=15, pady=(0, 15))
+
+        ttk.Button(
+            button_frame,
+            text="💾 Lưu",
+            command=lambda: self.save_settings(settings_window),
+            style="Success.Action.TButton",
+        ).pack(side=tk.RIGHT, padx=(10, 0))
+
+        ttk.Button(
+            button_frame,
+            text="🛑 Hủy",
+            command=settings_window.destroy,
+            style="Danger.Action.TButton",
+        ).pack(side=tk.RIGHT)
+
+        _show_dialog(settings_window)
+        # A grab needs a viewable window, so take it only once shown.
+        settings_window.grab_set()
+
+    def _create_settings_vars(self) -> None:
+        # Tcl variables for the settings dialog; each open only resets them.
+        self.default_max_workers = tk.StringVar()
+        self.check_updates = tk.BooleanVar()
+        self.retry_count = tk.StringVar()
+        self.sleep_interval = tk.StringVar()
+        self.rate_limit = tk.StringVar()
+        self.default_download_thumbnail = tk.BooleanVar()
+        self.default_download_subtitle = tk.BooleanVar()
+        self.subtitle_langs = tk.StringVar()
+        self.use_proxy = tk.BooleanVar()
+        self.proxy = tk.StringVar()
+        self.use_cookies = tk.BooleanVar()
+        self.cookies_file = tk.StringVar()
+
+    def _load_settings_vars(self) -> None:
+        default_options = self.config_manager.get_download_options()
+        self._settings_options = default_options
+
+        self.default_max_workers.set(str(default_options.max_workers))
+        self.check_updates.set(self.config_manager.general.check_for_updates)
+
+        self.retry_count.set(str(default_options.retry_count))
+        self.sleep_interval.set(str(default_options.sleep_interval))
+        self.rate_limit.set(default_options.rate_limit)
+        self.default_download_thumbnail.set(default_options.download_thumbnails)
+        self.default_download_subtitle.set(default_options.download_subtitles)
+        self.subtitle_langs.set(",".join(default_options.subtitle_languages))
+
+        self.use_proxy.set(bool(default_options.proxy))
+        self.proxy.set(default_options.proxy)
+        self.use_cookies.set(default_options.use_cookies)
+        self.cookies_file.set(default_options.cookies_file)
+
+    def _on_settings_tab_changed(self, event: Any) -> None:
+        self._build_settings_tab(event.widget.select())
 
+    def _build_settings_tab(self, tab_id: str) -> None:
+        if tab_id in self._settings_built or tab_id not in self._settings_builders:
+            return
+        self._settings_built.add(tab_id)
+        frame, builder = self._settings_builders[tab_id]
+        builder(frame)
+        frame.columnconfigure(1, weight=1)
+
+    def _build_general_tab(self, general_tab: Any) -> None:
         tk.Label(
             general_tab,
             text="📁 Thư mục lưu mặc định:",
-            font=("Segoe UI", 10, "bold"),
+            font=_FONT_BOLD_10,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=0, column=0, sticky=tk.W, pady=10)
@@ -867,192 +1087,151 @@ class GraphicalUserInterface:
         dir_frame.grid(row=0, column=1, sticky=tk.W + tk.E, pady=10, padx=(10, 0))
         dir_frame.columnconfigure(0, weight=1)
 
-        default_dir = self.config_manager.get_download_options().download_dir
-        self.default_dir_entry = ttk.Entry(
-            dir_frame, width=40, style="Modern.TEntry"
-        )
+        self.default_dir_entry = self._modern_entry(dir_frame, width=40)
         self.default_dir_entry.grid(row=0, column=0, sticky=tk.W + tk.E, padx=(0, 10))
-        self.default_dir_entry.insert(0, default_dir)
+        self.default_dir_entry.insert(0, self._settings_options.download_dir)
 
         browse_button = ttk.Button(
             dir_frame,
             text="📂 Duyệt...",
             command=self.browse_default_directory,
-            style="Warning.TButton",
+            style="Warning.Action.TButton",
         )
         browse_button.grid(row=0, column=1)
 
         tk.Label(
             general_tab,
             text="⚡ Số luồng tải xuống:",
-            font=("Segoe UI", 10, "bold"),
+            font=_FONT_BOLD_10,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=1, column=0, sticky=tk.W, pady=10)
 
-        max_workers = self.config_manager.get_download_options().max_workers
-        self.default_max_workers = tk.StringVar(value=str(max_workers))
-
         workers_frame = tk.Frame(general_tab, bg=ColorTheme.FRAME_BACKGROUND)
         workers_frame.grid(row=1, column=1, sticky=tk.W, pady=10, padx=(10, 0))
 
         ttk.Spinbox(
             workers_frame,
             from_=1,
-            to=10,
+            to=MAX_WORKERS_LIMIT,
             width=5,
             textvariable=self.default_max_workers,
-            font=("Segoe UI", 10),
+            font=_FONT_NORMAL_10,
         ).pack(side=tk.LEFT)
 
         tk.Label(
             workers_frame,
-            text="(khuyến nghị: 7, tối đa: 10)",
-            font=("Segoe UI", 9),
+            text=f"({_WORKERS_HINT})",
+            font=_FONT_NORMAL_9,
             fg=ColorTheme.TEXT_SECONDARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).pack(side=tk.LEFT, padx=(10, 0))
 
-        self.check_updates = tk.BooleanVar(
-            value=self.config_manager.config.getboolean(
-                "general", "check_for_updates", fallback=True
-            )
-        )
-
         update_frame = tk.Frame(general_tab, bg=ColorTheme.FRAME_BACKGROUND)
         update_frame.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=10)
 
-        ttk.Checkbutton(
+        self._modern_checkbutton(
             update_frame,
             text="🔔 Tự động kiểm tra cập nhật yt-dlp",
             variable=self.check_updates,
-            style="Modern.TCheckbutton",
         ).pack(side=tk.LEFT)
 
-        download_tab = tk.Frame(
-            notebook, bg=ColorTheme.FRAME_BACKGROUND, padx=20, pady=20
-        )
-        notebook.add(download_tab, text="⬇️ Tải xuống")
-
+    def _build_download_tab(self, download_tab: Any) -> None:
         tk.Label(
             download_tab,
             text="🔁 Số lần thử lại:",
-            font=("Segoe UI", 10, "bold"),
+            font=_FONT_BOLD_10,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=0, column=0, sticky=tk.W, pady=10)
 
-        default_options = self.config_manager.get_download_options()
-        self.retry_count = tk.StringVar(value=str(default_options.retry_count))
-        ttk.Entry(
-            download_tab, width=10, textvariable=self.retry_count, style="Modern.TEntry"
+        self._modern_entry(
+            download_tab, width=10, textvariable=self.retry_count
         ).grid(row=0, column=1, sticky=tk.W, pady=10, padx=(10, 0))
 
         tk.Label(
             download_tab,
             text="⏱️ Khoảng nghỉ giữa các lần tải (giây):",
-            font=("Segoe UI", 10, "bold"),
+            font=_FONT_BOLD_10,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=1, column=0, sticky=tk.W, pady=10)
 
-        self.sleep_interval = tk.StringVar(value=str(default_options.sleep_interval))
-        ttk.Entry(
-            download_tab, width=10, textvariable=self.sleep_interval, style="Modern.TEntry"
+        self._modern_entry(
+            download_tab, width=10, textvariable=self.sleep_interval
         ).grid(row=1, column=1, sticky=tk.W, pady=10, padx=(10, 0))
 
         tk.Label(
             download_tab,
             text="🚀 Giới hạn tốc độ tải:",
-            font=("Segoe UI", 10, "bold"),
+            font=_FONT_BOLD_10,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=2, column=0, sticky=tk.W, pady=10)
 
-        self.rate_limit = tk.StringVar(value=default_options.rate_limit)
-        ttk.Entry(
-            download_tab, width=20, textvariable=self.rate_limit, style="Modern.TEntry"
+        self._modern_entry(
+            download_tab, width=20, textvariable=self.rate_limit
         ).grid(row=2, column=1, sticky=tk.W, pady=10, padx=(10, 0))
 
-        self.default_download_thumbnail = tk.BooleanVar(
-            value=default_options.download_thumbnails
-        )
-        ttk.Checkbutton(
+        self._modern_checkbutton(
             download_tab,
             text="🖼️ Tải thumbnail theo mặc định",
             variable=self.default_download_thumbnail,
-            style="Modern.TCheckbutton",
         ).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=10)
 
-        self.default_download_subtitle = tk.BooleanVar(
-            value=default_options.download_subtitles
-        )
-        ttk.Checkbutton(
+        self._modern_checkbutton(
             download_tab,
             text="📝 Tải subtitle theo mặc định",
             variable=self.default_download_subtitle,
-            style="Modern.TCheckbutton",
         ).grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=10)
 
         tk.Label(
             download_tab,
             text="🌐 Ngôn ngữ subtitle:",
-            font=("Segoe UI", 10, "bold"),
+            font=_FONT_BOLD_10,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=5, column=0, sticky=tk.W, pady=10)
 
-        subtitle_langs = ",".join(default_options.subtitle_languages)
-        self.subtitle_langs = tk.StringVar(value=subtitle_langs)
-
         lang_frame = tk.Frame(download_tab, bg=ColorTheme.FRAME_BACKGROUND)
         lang_frame.grid(row=5, column=1, sticky=tk.W, pady=10, padx=(10, 0))
 
-        ttk.Entry(
-            lang_frame, width=20, textvariable=self.subtitle_langs, style="Modern.TEntry"
+        self._modern_entry(
+            lang_frame, width=20, textvariable=self.subtitle_langs
         ).pack(side=tk.LEFT)
 
         tk.Label(
             lang_frame,
             text="(phân cách bằng dấu phẩy)",
-            font=("Segoe UI", 9),
+            font=_FONT_NORMAL_9,
             fg=ColorTheme.TEXT_SECONDARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).pack(side=tk.LEFT, padx=(10, 0))
 
-        auth_tab = tk.Frame(notebook, bg=ColorTheme.FRAME_BACKGROUND, padx=20, pady=20)
-        notebook.add(auth_tab, text="🔐 Xác thực")
-
-        self.use_proxy = tk.BooleanVar(value=bool(default_options.proxy))
-
+    def _build_auth_tab(self, auth_tab: Any) -> None:
         proxy_check_frame = tk.Frame(auth_tab, bg=ColorTheme.FRAME_BACKGROUND)
         proxy_check_frame.grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=10)
 
-        ttk.Checkbutton(
+        self._modern_checkbutton(
             proxy_check_frame,
             text="🌐 Sử dụng proxy",
             variable=self.use_proxy,
             command=self.toggle_proxy,
-            style="Modern.TCheckbutton",
         ).pack(side=tk.LEFT)
 
         tk.Label(
             auth_tab,
             text="🔗 Địa chỉ proxy:",
-            font=("Segoe UI", 10, "bold"),
+            font=_FONT_BOLD_10,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=1, column=0, sticky=tk.W, pady=10)
 
-        self.proxy = tk.StringVar(value=default_options.proxy)
-
         proxy_frame = tk.Frame(auth_tab, bg=ColorTheme.FRAME_BACKGROUND)
         proxy_frame.grid(row=1, column=1, sticky=tk.W + tk.E, pady=10, padx=(10, 0))
         proxy_frame.columnconfigure(0, weight=1)
 
-        self.proxy_entry = ttk.Entry(
-            proxy_frame, textvariable=self.proxy, style="Modern.TEntry"
-        )
+        self.proxy_entry = self._modern_entry(proxy_frame, textvariable=self.proxy)
         self.proxy_entry.grid(row=0, column=0, sticky=tk.W + tk.E)
 
         if not self.use_proxy.get():
@@ -1061,28 +1240,25 @@ class GraphicalUserInterface:
         tk.Label(
             proxy_frame,
             text="(ví dụ: socks5://127.0.0.1:1080)",
-            font=("Segoe UI", 9),
+            font=_FONT_NORMAL_9,
             fg=ColorTheme.TEXT_SECONDARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
 
-        self.use_cookies = tk.BooleanVar(value=default_options.use_cookies)
-
         cookies_check_frame = tk.Frame(auth_tab, bg=ColorTheme.FRAME_BACKGROUND)
         cookies_check_frame.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(20, 10))
 
-        ttk.Checkbutton(
+        self._modern_checkbutton(
             cookies_check_frame,
             text="🍪 Sử dụng cookies",
             variable=self.use_cookies,
             command=self.toggle_cookies,
-            style="Modern.TCheckbutton",
         ).pack(side=tk.LEFT)
 
         tk.Label(
             auth_tab,
             text="📄 File cookies:",
-            font=("Segoe UI", 10, "bold"),
+            font=_FONT_BOLD_10,
             fg=ColorTheme.TEXT_PRIMARY,
             bg=ColorTheme.FRAME_BACKGROUND,
         ).grid(row=3, column=0, sticky=tk.W, pady=10)
@@ -1091,18 +1267,14 @@ class GraphicalUserInterface:
         cookies_frame.grid(row=3, column=1, sticky=tk.W + tk.E, pady=10, padx=(10, 0))
         cookies_frame.columnconfigure(0, weight=1)
 
-        self.cookies_file = tk.StringVar(value=default_options.cookies_file)
-
-        self.cookies_entry = ttk.Entry(
-            cookies_frame, textvariable=self.cookies_file, style="Modern.TEntry"
-        )
+        self.cookies_entry = self._modern_entry(cookies_frame, textvariable=self.cookies_file)
         self.cookies_entry.grid(row=0, column=0, sticky=tk.W + tk.E, padx=(0, 10))
 
         cookies_browse = ttk.Button(
             cookies_frame,
             text="📂 Duyệt...",
             command=self.browse_cookies_file,
-            style="Warning.TButton",
+            style="Warning.Action.TButton",
         )
         cookies_browse.grid(row=0, column=1)
 
@@ -1111,27 +1283,6 @@ class GraphicalUserInterface:
             cookies_browse.config(state=tk.DISABLED)
         self.cookies_browse = cookies_browse
 
-        button_frame = tk.Frame(settings_window, bg=ColorTheme.BACKGROUND)
-        button_frame.pack(fill=tk.X, padx=15, pady=(0, 15))
-
-        ttk.Button(
-            button_frame,
-            text="💾 Lưu",
-            command=lambda: self.save_settings(settings_window),
-            style="Success.TButton",
-        ).pack(side=tk.RIGHT, padx=(10, 0))
-
-        ttk.Button(
-            button_frame,
-            text="🛑 Hủy",
-            command=settings_window.destroy,
-            style="Danger.TButton",
-        ).pack(side=tk.RIGHT)
-
-        general_tab.columnconfigure(1, weight=1)
-        download_tab.columnconfigure(1, weight=1)
-        auth_tab.columnconfigure(1, weight=1)
-
     def browse_default_directory(self) -> None:
         directory = filedialog.askdirectory(initialdir=self.default_dir_entry.get())
         if directory:
@@ -1165,44 +1316,52 @@ class GraphicalUserInterface:
             self.cookies_browse.config(state=tk.DISABLED)
 
     def save_settings(self, window: tk.Toplevel) -> None:
+        # Validate before anything is merged into the config.
         try:
-            self.config_manager.config.setdefault("general", {})
-            self.config_manager.config["general"]["download_dir"] = (
-                self.default_dir_entry.get()
-            )
-            self.config_manager.config["general"]["max_workers"] = (
-                self.default_max_workers.get()
-            )
-            self.config_manager.config["general"]["check_for_updates"] = (
-                str(self.check_updates.get()).lower()
+            retry_count = max(0, int(self.retry_count.get()))
+            sleep_interval = max(0, int(self.sleep_interval.get()))
+        except ValueError:
+            messagebox.showerror(
+                "Lỗi", "Số lần thử lại và thời gian chờ phải là số nguyên."
             )
+            return
 
-            self.config_manager.config.setdefault("download", {})
-            self.config_manager.config["download"]["retry_count"] = self.retry_count.get()
-            self.config_manager.config["download"]["sleep_interval"] = self.sleep_interval.get()
-            self.config_manager.config["download"]["rate_limit"] = self.rate_limit.get()
-            self.config_manager.config["download"]["download_thumbnails"] = str(
-                self.default_download_thumbnail.get()
-            ).lower()
-            self.config_manager.config["download"]["download_subtitles"] = str(
-                self.default_download_subtitle.get()
-            ).lower()
-            self.config_manager.config["download"]["subtitle_languages"] = (
-                self.subtitle_langs.get()
+        try:
+            max_workers = max(
+                1, min(int(self.default_max_workers.get()), MAX_WORKERS_LIMIT)
             )
-
-            self.config_manager.config.setdefault("authentication", {})
-            self.config_manager.config["authentication"]["use_proxy"] = str(
-                self.use_proxy.get()
-            ).lower()
-            self.config_manager.config["authentication"]["proxy"] = (
-                self.proxy.get() if self.use_proxy.get() else ""
+            self.default_max_workers.set(str(max_workers))
+            self.config_manager.update_general(
+                GeneralOptions(
+                    download_dir=self.default_dir_entry.get(),
+                    max_workers=max_workers,
+                    check_for_updates=self.check_updates.get(),
+                )
             )
-            self.config_manager.config["authentication"]["use_cookies"] = str(
-                self.use_cookies.get()
-            ).lower()
-            self.config_manager.config["authentication"]["cookies_file"] = (
-                self.cookies_file.get() if self.use_cookies.get() else ""
+
+            use_proxy = self.use_proxy.get()
+            use_cookies = self.use_cookies.get()
+            self.config_manager.update_sections(
+                {
+                    "download": {
+                        "retry_count": str(retry_count),
+                        "sleep_interval": str(sleep_interval),
+                        "rate_limit": self.rate_limit.get(),
+                        "download_thumbnails": str(
+                            self.default_download_thumbnail.get()
+                        ).lower(),
+                        "download_subtitles": str(
+                            self.default_download_subtitle.get()
+                        ).lower(),
+                        "subtitle_languages": self.subtitle_langs.get(),
+                    },
+                    "authentication": {
+                        "use_proxy": str(use_proxy).lower(),
+                        "proxy": self.proxy.get() if use_proxy else "",
+                        "use_cookies": str(use_cookies).lower(),
+                        "cookies_file": self.cookies_file.get() if use_cookies else "",
+                    },
+                }
             )
 
             self.config_manager.save_config()
@@ -1210,7 +1369,7 @@ class GraphicalUserInterface:
 
             self.save_dir_entry.delete(0, tk.END)
             self.save_dir_entry.insert(0, self.default_dir_entry.get())
-            self.max_workers.set(self.default_max_workers.get())
+            self.max_workers.set(str(max_workers))
             self.download_thumbnail.set(self.default_download_thumbnail.get())
             self.download_subtitle.set(self.default_download_subtitle.get())
 
@@ -1220,7 +1379,12 @@ class GraphicalUserInterface:
             messagebox.showerror("Lỗi", f"Không thể lưu cài đặt: {exc}")
 
     def show_help(self) -> None:
-        help_window = tk.Toplevel(self.root)
+        if _reopen_dialog(self._help_window):
+            return
+
+        help_window = _new_dialog(self.root)
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        self._help_window = help_window
         help_window.title("Hướng dẫn sử dụng")
         help_window.geometry("700x500")
         help_window.minsize(700, 500)
@@ -1228,50 +1392,17 @@ class GraphicalUserInterface:
         help_text = scrolledtext.ScrolledText(help_window, wrap=tk.WORD, padx=10, pady=10)
         help_text.pack(fill=tk.BOTH, expand=True)
 
-        help_content = """# HƯỚNG DẪN SỬ DỤNG YOUTUBE DOWNLOADER PRO
-
-## Giới thiệu
-YouTube downloader Pro là công cụ tải video/audio từ YouTube với nhiều tính năng nâng cao. Ứng dụng hỗ trợ tải video đơn lẻ hoặc playlist với nhiều tùy chọn định dạng khác nhau.
-
-## Các bước cơ bản
-1. Nhập URL video hoặc playlist YouTube vào ô URL
-2. Nhấn nút "Phân tích" để lấy thông tin
-3. Chọn chế độ tải xuống phù hợp
-4. Nhấn nút "Tải xuống" để bắt đầu tải
-
-## Các chế độ tải xuống
-- **Chỉ audio (MP3)**: Tải audio chất lượng cao nhất và chuyển sang MP3
-- **Chỉ video (không audio)**: Tải video MP4 không có âm thanh
-- **Video + audio (MP4)**: Tải và ghép video+audio chất lượng cao nhất
-- **Chọn format cụ thể**: Tải format cụ thể theo format ID
-
-## Tùy chọn nâng cao
-- **Tải thumbnail**: Tải hình thumbnail của video
-- **Tải subtitle**: Tải phụ đề của video (nếu có)
-- **Số luồng**: Số lượng video tải song song (đối với playlist)
-
-## Cài đặt
-Bạn có thể tùy chỉnh các cài đặt khác trong menu File > Cài đặt:
-- Thư mục lưu mặc định
-- Số luồng tải xuống
-- Giới hạn tốc độ
-- Proxy và cookies
-- Và nhiều tùy chọn khác
-
-## Yêu cầu hệ thống
-- Python 3.6 trở lên
-- FFmpeg (cần thiết để chuyển đổi định dạng)
-- yt-dlp
-
-## Lưu ý
-- Việc tải xuống nội dung có bản quyền có thể vi phạm điều khoản dịch vụ của YouTube
-- Chỉ sử dụng cho mục đích cá nhân và tuân thủ luật bản quyền
-"""
-        help_text.insert(tk.END, help_content)
+        help_text.insert(tk.END, _HELP_CONTENT)
         help_text.config(state=tk.DISABLED)
+        _show_dialog(help_window)
 
     def show_about(self) -> None:
-        about_window = tk.Toplevel(self.root)
+        if _reopen_dialog(self._about_window):
+            return
+
+        about_window = _new_dialog(self.root)
+        about_window.protocol("WM_DELETE_WINDOW", about_window.withdraw)
+        self._about_window = about_window
         about_window.title("Giới thiệu")
         about_window.geometry("400x300")
         about_window.minsize(400, 300)
@@ -1281,7 +1412,7 @@ Bạn có thể tùy chỉnh các cài đặt khác trong menu File > Cài đặ
         logo_frame.pack(pady=(20, 10))
 
         ttk.Label(
-            logo_frame, text="YouTube downloader Pro", font=("Helvetica", 16, "bold")
+            logo_frame, text="YouTube downloader Pro", font=_FONT_TITLE_16
         ).pack()
 
         info_frame = ttk.Frame(about_window)
@@ -1294,7 +1425,11 @@ Bạn có thể tùy chỉnh các cài đặt khác trong menu File > Cài đặ
         ttk.Label(info_frame, text="Tác giả: YouTube downloader Team").pack(anchor=tk.W, pady=2)
         ttk.Label(info_frame, text="Copyright © 2025").pack(anchor=tk.W, pady=2)
 
-        ttk.Button(about_window, text="Đóng", command=about_window.destroy).pack(pady=(0, 20))
+        ttk.Button(about_window, text="Đóng", command=about_window.withdraw).pack(pady=(0, 20))
+        _show_dialog(about_window)
 
     def run(self) -> None:
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.downloader.cleanup()
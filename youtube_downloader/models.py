@@ -3,14 +3,34 @@
 from __future__ import annotations
 
 import os
+import sys
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from .constants import DEFAULT_DOWNLOAD_DIR
-from .utils import format_size
-
-
-@dataclass
+from .constants import (
+    DEFAULT_DOWNLOAD_DIR,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_STREAMS_PER_FILE,
+    MAX_STREAMS_PER_FILE,
+)
+from .utils import format_size, parse_rate_limit
+
+# ``slots=True`` needs Python 3.10+; older interpreters keep regular instances.
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+# yt-dlp options that never vary between downloads; copied per call.
+_BASE_YT_DLP_OPTS: Dict[str, Any] = {
+    "quiet": False,
+    "no_warnings": False,
+    "ignoreerrors": False,
+    "socket_timeout": 30,
+}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class VideoFormat:
     format_id: str
     ext: str
@@ -20,19 +40,37 @@ class VideoFormat:
     has_audio: bool = False
     has_video: bool = False
     bitrate: float = 0
+    # Formats are not modified after extraction, so the label is built once.
+    _display_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __str__(self) -> str:
+        if self._display_cache is not None:
+            return self._display_cache
+
         size_str = format_size(self.filesize) if self.filesize else "Không xác định"
         if self.has_video:
             audio_state = "cả audio" if self.has_audio else "không audio"
-            return (
+            display = (
                 f"{self.format_id}: {self.resolution}, {self.fps} fps, "
                 f"{self.ext}, {size_str}, {audio_state}"
             )
-        return f"{self.format_id}: audio {self.ext}, {self.bitrate} kbps, {size_str}"
+        else:
+            display = (
+                f"{self.format_id}: audio {self.ext}, {self.bitrate} kbps, {size_str}"
+            )
+        self._display_cache = display
+        return display
 
 
-@dataclass
+def _resolution_key(fmt: VideoFormat) -> int:
+    """Sort key for formats: the height from ``720p`` style labels, else 0."""
+    height = fmt.resolution[:-1]
+    return int(height) if height.isdigit() else 0
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class VideoInfo:
     video_id: str
     title: str
@@ -44,6 +82,25 @@ class VideoInfo:
     thumbnail: str = ""
     description: str = ""
     url: str = ""
+    # Derived from ``formats`` once: best resolution / bitrate first.
+    video_formats_sorted: List[VideoFormat] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    audio_formats_sorted: List[VideoFormat] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.video_formats_sorted = sorted(
+            (f for f in self.formats if f.has_video),
+            key=_resolution_key,
+            reverse=True,
+        )
+        self.audio_formats_sorted = sorted(
+            (f for f in self.formats if not f.has_video and f.has_audio),
+            key=attrgetter("bitrate"),
+            reverse=True,
+        )
 
     @classmethod
     def from_yt_dlp_info(cls, info: Dict[str, Any]) -> "VideoInfo":
@@ -95,7 +152,7 @@ class VideoInfo:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PlaylistInfo:
     playlist_id: str
     title: str
@@ -112,15 +169,24 @@ class PlaylistInfo:
         title = info.get("title", "Không có tiêu đề")
         uploader = info.get("uploader", "Không xác định")
 
-        video_count = info.get("playlist_count", 0)
-        if not video_count and "entries" in info:
-            video_count = len(list(info.get("entries") or []))
+        video_count = info.get("playlist_count") or info.get("n_entries") or 0
+        entries = info.get("entries") or []
 
         videos: List[VideoInfo] = []
-        if include_videos and "entries" in info:
-            for entry in info.get("entries", []):
-                if entry:
-                    videos.append(VideoInfo.from_yt_dlp_info(entry))
+        if include_videos:
+            # Every entry is visited here anyway, so a list costs nothing extra.
+            if not isinstance(entries, list):
+                entries = list(entries)
+            from_info = VideoInfo.from_yt_dlp_info
+            videos = [from_info(entry) for entry in entries if entry]
+            video_count = video_count or len(entries)
+        elif not video_count:
+            # Entries may be a lazy iterator; count without materialising it.
+            video_count = (
+                len(entries)
+                if hasattr(entries, "__len__")
+                else sum(1 for _ in entries)
+            )
 
         return cls(
             playlist_id=playlist_id,
@@ -132,7 +198,7 @@ class PlaylistInfo:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DownloadProgress:
     filename: str = ""
     percent: float = 0
@@ -142,6 +208,11 @@ class DownloadProgress:
     error_message: str = ""
     bytes_downloaded: int = 0
     total_bytes: int = 0
+    # Bookkeeping for throttling progress notifications.
+    _last_notify_bytes: int = field(default=0, init=False, repr=False, compare=False)
+    _last_notify_time: float = field(
+        default=0.0, init=False, repr=False, compare=False
+    )
 
     def __str__(self) -> str:
         if self.status == "waiting":
@@ -158,7 +229,16 @@ class DownloadProgress:
         return ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
+class GeneralOptions:
+    """Typed view of the ``[general]`` config section."""
+
+    download_dir: str = DEFAULT_DOWNLOAD_DIR
+    max_workers: int = DEFAULT_MAX_WORKERS
+    check_for_updates: bool = True
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class DownloadOptions:
     format_selector: str = "best"
     output_template: str = "%(title)s.%(ext)s"
@@ -177,7 +257,12 @@ class DownloadOptions:
     download_thumbnails: bool = False
     download_subtitles: bool = False
     subtitle_languages: List[str] = field(default_factory=lambda: ["vi", "en"])
-    max_workers: int = 1
+    max_workers: int = DEFAULT_MAX_WORKERS
+    # Run fewer than max_workers downloads while the server throttles, probing
+    # back up to max_workers as throughput recovers.
+    adaptive_concurrency: bool = True
+    # Connections per video for DASH/HLS fragments, independent of max_workers.
+    streams_per_file: int = DEFAULT_STREAMS_PER_FILE
     retry_count: int = 10
     fragment_retries: int = 10
     skip_unavailable_fragments: bool = True
@@ -185,23 +270,19 @@ class DownloadOptions:
     sleep_interval: int = 3
 
     def to_yt_dlp_options(self, is_playlist: bool = False) -> Dict[str, Any]:
-        opts: Dict[str, Any] = {
-            "format": self.format_selector,
-            "outtmpl": self.output_template,
-            "noplaylist": not is_playlist,
-            "quiet": False,
-            "no_warnings": False,
-            "progress_hooks": [],
-            "retries": self.retry_count,
-            "fragment_retries": self.fragment_retries,
-            "skip_unavailable_fragments": self.skip_unavailable_fragments,
-            "ignoreerrors": False,
-            "continue": self.continue_incomplete,
-            "socket_timeout": 30,
-            "ratelimit": int(self.rate_limit.rstrip("K")) * 1024
-            if self.rate_limit and self.rate_limit.endswith("K")
-            else None,
-        }
+        opts = _BASE_YT_DLP_OPTS.copy()
+        opts["format"] = self.format_selector
+        opts["outtmpl"] = self.output_template
+        opts["noplaylist"] = not is_playlist
+        opts["progress_hooks"] = []
+        opts["retries"] = self.retry_count
+        opts["fragment_retries"] = self.fragment_retries
+        opts["concurrent_fragment_downloads"] = max(
+            1, min(self.streams_per_file, MAX_STREAMS_PER_FILE)
+        )
+        opts["skip_unavailable_fragments"] = self.skip_unavailable_fragments
+        opts["continue"] = self.continue_incomplete
+        opts["ratelimit"] = parse_rate_limit(self.rate_limit)
 
         if self.proxy:
             opts["proxy"] = self.proxy
@@ -216,22 +297,20 @@ class DownloadOptions:
         if self.merge:
             opts["merge_output_format"] = self.merge_format
 
+        postprocessors: List[Dict[str, Any]] = []
+
         if self.download_thumbnails:
-            opts.setdefault("postprocessors", []).append(
-                {"key": "FFmpegThumbnailsConvertor", "format": "jpg"}
-            )
+            postprocessors.append({"key": "FFmpegThumbnailsConvertor", "format": "jpg"})
             opts["writethumbnail"] = True
 
         if self.download_subtitles:
-            opts.setdefault("postprocessors", []).append(
-                {"key": "FFmpegSubtitlesConvertor", "format": "srt"}
-            )
+            postprocessors.append({"key": "FFmpegSubtitlesConvertor", "format": "srt"})
             opts["writesubtitles"] = True
             opts["writeautomaticsub"] = True
             opts["subtitleslangs"] = self.subtitle_languages
 
         if self.convert_to_mp3:
-            opts.setdefault("postprocessors", []).append(
+            postprocessors.append(
                 {
                     "key": "FFmpegExtractAudio",
                     "preferredcodec": "mp3",
@@ -239,10 +318,13 @@ class DownloadOptions:
                 }
             )
 
+        if postprocessors:
+            opts["postprocessors"] = postprocessors
+
         return opts
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DownloadTask:
     url: str
     options: DownloadOptions
@@ -252,6 +334,12 @@ class DownloadTask:
     video_info: Optional[VideoInfo] = None
     is_playlist: bool = False
     playlist_info: Optional[PlaylistInfo] = None
+    # "[index/total] " for playlist items, empty otherwise.
+    progress_prefix: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.index > 0 and self.total > 0:
+            self.progress_prefix = f"[{self.index}/{self.total}] "
 
     def get_display_name(self) -> str:
         if self.video_info:
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-try:
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
     from tkinter import ttk
-except ImportError:  # pragma: no cover - platform without tkinter
-    ttk = None  # type: ignore[assignment]
 
 
 class ColorTheme:
@@ -42,8 +42,10 @@ class ModernStyle:
 
     @staticmethod
     def configure_ttk_style() -> "ttk.Style":
-        if ttk is None:
-            raise RuntimeError("tkinter is not available on this system.")
+        try:
+            from tkinter import ttk
+        except ImportError as exc:  # pragma: no cover - platform without tkinter
+            raise RuntimeError("tkinter is not available on this system.") from exc
 
         style = ttk.Style()
 
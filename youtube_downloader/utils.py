@@ -2,50 +2,134 @@
 
 from __future__ import annotations
 
+import json
+import math
 import os
 import re
-from typing import Iterable
+import tempfile
+from functools import lru_cache
+from typing import Any, Optional, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 
 ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
+_RATE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+_SIZE_DIVISORS = (1, 1024, 1024**2, 1024**3)
+
+_SANITIZE_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*\x00'})
+_MAX_FILENAME_BYTES = 200
+
 
 def clean_ansi(text: str) -> str:
     """Remove ANSI escape sequences from text."""
+    if "\x1b" not in text:
+        return text
     return ANSI_ESCAPE.sub("", text)
 
 
+def atomic_write(path: str, content: str) -> None:
+    """Write ``content`` to ``path`` without leaving a torn file on crash."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    # A unique temp file per call keeps concurrent writers from clobbering
+    # each other's half-written data before the rename.
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialise ``obj`` to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=32)
+def parse_rate_limit(value: str) -> Optional[int]:
+    """Convert a rate such as ``500K`` or ``2M`` to bytes per second."""
+    value = value.strip().upper()
+    if not value:
+        return None
+
+    unit = value[-1] if value[-1] in _RATE_UNITS else ""
+    number = value[: len(value) - len(unit)]
+    try:
+        rate = float(number) * _RATE_UNITS[unit]
+    except ValueError:
+        return None
+    # "inf" or "1e400" parse fine but cannot become an int.
+    if not math.isfinite(rate) or rate <= 0:
+        return None
+    return int(rate)
+
+
 def format_duration(seconds: int) -> str:
     """Format seconds into HH:MM:SS (or MM:SS when hours are zero)."""
     if not seconds:
         return "Không xác định"
 
+    if seconds < 3600:
+        minutes, seconds = divmod(seconds, 60)
+        return f"{minutes}:{seconds:02d}"
+
     hours, remainder = divmod(seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
 
-    if hours:
-        return f"{hours}:{minutes:02d}:{seconds:02d}"
-    return f"{minutes}:{seconds:02d}"
+
+def format_count(count: int) -> str:
+    """Format an integer with dot thousands separators (``1.234.567``)."""
+    return f"{count:_}".replace("_", ".")
 
 
 def format_size(bytes_size: int) -> str:
     """Convert byte counts to a human-readable string."""
     if bytes_size < 1024:
         return f"{bytes_size} B"
-    if bytes_size < 1024 * 1024:
-        return f"{bytes_size / 1024:.2f} KB"
-    if bytes_size < 1024 * 1024 * 1024:
-        return f"{bytes_size / (1024 * 1024):.2f} MB"
-    return f"{bytes_size / (1024 * 1024 * 1024):.2f} GB"
+    # Each unit step is 10 bits, so the bit length picks the unit directly.
+    idx = min((int(bytes_size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{bytes_size / _SIZE_DIVISORS[idx]:.2f} {_SIZE_UNITS[idx]}"
 
 
 def sanitize(filename: str) -> str:
     """Make a filename safe for most filesystems."""
-    invalid_chars: Iterable[str] = r'<>:"/\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, "_")
-
-    if len(filename) > 200:
-        filename = filename[:197] + "..."
+    filename = filename.translate(_SANITIZE_TABLE).strip()
+    if not filename:
+        # An empty name would make os.path.join resolve to the parent dir.
+        return "_"
+
+    # Filesystems limit names in bytes, not characters. UTF-8 needs at most
+    # four bytes per character, so short names skip the encode entirely.
+    if len(filename) * 4 > _MAX_FILENAME_BYTES:
+        encoded = filename.encode("utf-8", "ignore")
+        if len(encoded) > _MAX_FILENAME_BYTES:
+            head = encoded[: _MAX_FILENAME_BYTES - 3]
+            # "ignore" drops a multi-byte character cut in half by the slice.
+            filename = head.decode("utf-8", "ignore") + "..."
 
     return filename
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import re
 import subprocess
 import sys
+import time
+import urllib.error
 import urllib.request
-from typing import Tuple
+from typing import Any, Dict, Tuple
 
-from .constants import YT_DLP_LATEST_VERSION_URL
+from .constants import (
+    VERSION_CACHE_FILE,
+    VERSION_CHECK_TTL,
+    YT_DLP_LATEST_VERSION_URL,
+)
+from .utils import atomic_write, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -20,16 +27,72 @@ except ImportError:  # pragma: no cover - handled elsewhere
     yt_dlp_version = "unknown"
 
 
+def _version_key(version: str) -> Tuple[int, ...]:
+    """Turn ``2024.03.10`` style versions into comparable integer tuples."""
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
+
 class VersionChecker:
     """Check for available yt-dlp updates."""
 
-    @staticmethod
-    def check_for_updates() -> Tuple[bool, str]:
+    cache_file = VERSION_CACHE_FILE
+
+    @classmethod
+    def _load_cache(cls) -> Dict[str, Any]:
         try:
-            logger.info("Đang kiểm tra phiên bản mới của yt-dlp...")
-            with urllib.request.urlopen(YT_DLP_LATEST_VERSION_URL, timeout=5) as resp:
-                data = json.loads(resp.read().decode())
+            with open(cls.cache_file, "rb") as cache_file:
+                return json_loads(cache_file.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.debug("Không thể đọc cache phiên bản: %s", exc)
+            return {}
+
+    @classmethod
+    def _save_cache(cls, cache: Dict[str, Any]) -> None:
+        try:
+            atomic_write(cls.cache_file, json_dumps(cache))
+        except Exception as exc:
+            logger.debug("Không thể lưu cache phiên bản: %s", exc)
+
+    @classmethod
+    def fetch_latest_version(cls) -> str:
+        """Return the latest yt-dlp release, reusing the on-disk cache.
+
+        Within ``VERSION_CHECK_TTL`` no request is made; afterwards a
+        conditional GET lets GitHub answer 304 without a body.
+        """
+        cache = cls._load_cache()
+        cached_latest = cache.get("latest", "")
+        if cached_latest and time.time() - cache.get("checked_at", 0) < VERSION_CHECK_TTL:
+            return cached_latest
+
+        headers = {"Accept": "application/vnd.github+json"}
+        if cached_latest and cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+
+        request = urllib.request.Request(YT_DLP_LATEST_VERSION_URL, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=5) as resp:
+                data = json_loads(resp.read())
+                etag = resp.headers.get("ETag", "")
             latest_version = data["tag_name"].lstrip("v")
+        except urllib.error.HTTPError as exc:
+            if exc.code != 304 or not cached_latest:
+                raise
+            etag = cache.get("etag", "")
+            latest_version = cached_latest
+
+        cls._save_cache(
+            {"etag": etag, "checked_at": time.time(), "latest": latest_version}
+        )
+        return latest_version
+
+    @classmethod
+    def check_for_updates(cls) -> Tuple[bool, str]:
+        try:
+            logger.info("Đang kiểm tra phiên bản mới của yt-dlp...")
+            latest_version = cls.fetch_latest_version()
             current_version = yt_dlp_version
 
             logger.info(
@@ -40,7 +103,7 @@ class VersionChecker:
 
             if current_version == "unknown":
                 return True, latest_version
-            if latest_version > current_version:
+            if _version_key(latest_version) > _version_key(current_version):
                 return True, latest_version
             return False, current_version
         except Exception as exc: